@@ -35,9 +35,14 @@ impl ZipScanner {
         }
         
         // Find the last dot for extension
+        // Compare case-insensitively in place rather than allocating a
+        // lowercased copy of every member's extension.
         if let Some(dot_pos) = filename.rfind('.') {
-            let ext = &filename[dot_pos..].to_lowercase();
-            return self.image_extensions.contains(ext);
+            let ext = &filename[dot_pos..];
+            return self
+                .image_extensions
+                .iter()
+                .any(|known| known.eq_ignore_ascii_case(ext));
         }
         false
     }
@@ -126,26 +131,30 @@ impl ZipScanner {
 
     fn batch_analyze_zips(
         &self,
+        py: Python<'_>,
         zip_paths: Vec<String>,
         collect_members: Option<bool>,
     ) -> PyResult<Vec<(String, bool, Option<Vec<String>>, Option<f64>, Option<u64>, u32)>> {
         let should_collect = collect_members.unwrap_or(true);
         
-        // Use rayon for parallel processing
-        let results: Vec<(String, bool, Option<Vec<String>>, Option<f64>, Option<u64>, u32)> = zip_paths
-            .into_par_iter()
-            .map(|zip_path| {
-                let analysis_result = self.analyze_zip(&zip_path, Some(should_collect));
-                match analysis_result {
-                    Ok((is_valid, members, mod_time, file_size, image_count)) => {
-                        (zip_path, is_valid, members, mod_time, file_size, image_count)
+        // Use rayon for parallel processing; the GIL is released so Qt and
+        // Python worker threads keep running while archives are parsed.
+        let results: Vec<(String, bool, Option<Vec<String>>, Option<f64>, Option<u64>, u32)> = py.allow_threads(|| {
+            zip_paths
+                .into_par_iter()
+                .map(|zip_path| {
+                    let analysis_result = self.analyze_zip(&zip_path, Some(should_collect));
+                    match analysis_result {
+                        Ok((is_valid, members, mod_time, file_size, image_count)) => {
+                            (zip_path, is_valid, members, mod_time, file_size, image_count)
+                        }
+                        Err(_) => {
+                            (zip_path, false, None, None, None, 0)
+                        }
                     }
-                    Err(_) => {
-                        (zip_path, false, None, None, None, 0)
-                    }
-                }
-            })
-            .collect();
+                })
+                .collect()
+        });
         
         Ok(results)
     }
@@ -3,14 +3,18 @@ Core module integrating Rust backend with Python frontend.
 """
 
 import io
+import logging
 import os
+import sys
 import threading
 import queue
-from typing import Optional, List, Tuple
+import zipfile
+from typing import Dict, Optional, List, Tuple
 from concurrent.futures import ThreadPoolExecutor
 from collections import OrderedDict
+from contextlib import contextmanager
 
-from PIL import Image, ImageOps, UnidentifiedImageError
+from PIL import Image, ImageOps, UnidentifiedImageError, __version__ as PIL_VERSION
 
 try:
     from . import arkview_core
@@ -23,24 +27,135 @@ except ImportError:
     ImageProcessorRust = None
 
 
+logger = logging.getLogger(__name__)
+
+# pillow-simd is installed in place of Pillow and versions itself with a
+# ".postN" suffix; its vectorized BILINEAR is cheap enough for performance mode.
+PILLOW_SIMD = ".post" in PIL_VERSION
+
+# Image suffixes grouped by length, so a single endswith() call per group finds
+# the suffix and its length; the character before the dot must exist and not
+# be a separator, which rejects directories and bare ".png" names.
+_IMAGE_SUFFIXES_4 = (".jpg", ".png", ".gif", ".bmp", ".ico")
+_IMAGE_SUFFIXES_5 = (".jpeg", ".tiff", ".webp")
+
+# Formats PIL decodes without seeking back, safe to read from an inflating stream.
+_SEQUENTIAL_SUFFIXES = (".jpg", ".jpeg")
+
+_EXIF_ORIENTATION_TAG = 0x0112
+# Orientations that need a transpose; 1 (and missing/invalid values) mean upright.
+_TRANSPOSED_ORIENTATIONS = frozenset(range(2, 9))
+
+
+# Bytes per pixel for modes whose bands are wider than one byte; every other
+# mode stores one byte per band.
+_WIDE_MODE_BYTES = {
+    "I": 4, "F": 4, "I;32": 4, "I;32L": 4, "I;32B": 4, "I;32N": 4,
+    "I;16": 2, "I;16L": 2, "I;16B": 2, "I;16N": 2,
+}
+
+
+def _image_nbytes(img: Image.Image) -> int:
+    """Approximate size of an image's decoded pixel buffer."""
+    bytes_per_pixel = _WIDE_MODE_BYTES.get(img.mode) or len(img.getbands())
+    return img.width * img.height * bytes_per_pixel
+
+
+class _CacheNode:
+    """Entry in LRUCache's queue, linked from newest (head) to oldest (tail)."""
+    __slots__ = ("key", "value", "nbytes", "visited", "newer", "older")
+
+    def __init__(self, key: tuple, value: Image.Image, nbytes: int):
+        self.key = key
+        self.value = value
+        self.nbytes = nbytes
+        self.visited = False
+        self.newer: Optional["_CacheNode"] = None
+        self.older: Optional["_CacheNode"] = None
+
+
 class LRUCache:
-    """Simple Least Recently Used (LRU) cache for Image objects."""
-    def __init__(self, capacity: int):
-        self.cache = OrderedDict()
+    """
+    Cache for Image objects using the SIEVE eviction policy.
+
+    Entries sit in a FIFO queue that is never reordered. A hit only sets the
+    entry's visited bit, so get() needs no lock. On eviction a hand walks from
+    the oldest entry towards the newest, clearing visited bits, and evicts
+    the first unvisited entry; the hand keeps its position between
+    evictions. Hit rates match or beat LRU for scan-heavy browsing while
+    reads stay a dict lookup.
+
+    Cached images are shared with whoever fetched them and are treated as
+    read-only: nothing copies on put or get, and anything that needs a
+    modified image must derive a new one.
+
+    Keys whose load failed for a reason that will not change on retry are
+    remembered separately (bounded, oldest first out), so neighbour
+    prefetches and thumbnail passes do not keep re-opening broken members.
+
+    Besides the entry count, an optional max_bytes bounds the decoded pixel
+    data held; a single image larger than the whole budget is not admitted.
+    """
+    MAX_FAILURES = 1024
+
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None):
         self.capacity = capacity
+        self.max_bytes = max_bytes
+        self._bytes = 0
         self._lock = threading.Lock()
+        self._nodes: Dict[tuple, _CacheNode] = {}
+        self._head: Optional[_CacheNode] = None
+        self._tail: Optional[_CacheNode] = None
+        self._hand: Optional[_CacheNode] = None
+        self._failures: OrderedDict = OrderedDict()
 
     def get(self, key: tuple) -> Optional[Image.Image]:
-        with self._lock:
-            if key not in self.cache:
-                return None
-            else:
-                self.cache.move_to_end(key)
-                return self.cache[key]
+        node = self._nodes.get(key)
+        if node is None:
+            return None
+        node.visited = True
+        return node.value
+
+    def _evict_one(self, keep: Optional[_CacheNode] = None) -> _CacheNode:
+        """
+        Moves the hand to a victim and unlinks it, never choosing keep.
+        Caller must hold the lock and, when passing keep, ensure another
+        entry exists.
+        """
+        node = self._hand or self._tail
+        # Bound the sweep so concurrent readers re-setting bits cannot stall it.
+        for _ in range(len(self._nodes)):
+            if node is not keep:
+                if not node.visited:
+                    break
+                node.visited = False
+            node = node.newer or self._tail
+        if node is keep:
+            node = node.newer or self._tail
+        self._hand = node.newer
+        self._unlink(node)
+        del self._nodes[node.key]
+        self._bytes -= node.nbytes
+        return node
+
+    def _over_budget(self, extra_bytes: int = 0) -> bool:
+        """Caller must hold the lock."""
+        return self.max_bytes is not None and self._bytes + extra_bytes > self.max_bytes
+
+    def _unlink(self, node: _CacheNode):
+        if node.newer is not None:
+            node.newer.older = node.older
+        else:
+            self._head = node.older
+        if node.older is not None:
+            node.older.newer = node.newer
+        else:
+            self._tail = node.newer
+        node.newer = node.older = None
 
     def put(self, key: tuple, value: Image.Image):
         if not isinstance(value, Image.Image):
-            print(f"Cache Warning: Attempted to cache non-Image object for key {key}")
+            logger.debug("Cache: ignoring non-Image object for key %s", key)
             return
         with self._lock:
             try:
@@ -48,43 +163,84 @@ class LRUCache:
                 if hasattr(value, 'load'):
                     value.load()
             except Exception as e:
-                print(f"Cache Warning: Failed to load image data before caching key {key}: {e}")
+                logger.warning("Cache: failed to load image data before caching key %s: %s", key, e)
                 return
 
-            if key in self.cache:
-                self.cache[key] = value
-                self.cache.move_to_end(key)
+            nbytes = _image_nbytes(value)
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                logger.debug("Cache: %s (%d bytes) exceeds the whole byte budget, not cached", key, nbytes)
+                return
+            node = self._nodes.get(key)
+            if node is not None:
+                self._bytes += nbytes - node.nbytes
+                node.value = value
+                node.nbytes = nbytes
+                node.visited = True
+                # A larger replacement can push the total over budget.
+                while len(self._nodes) > 1 and self._over_budget():
+                    self._evict_one(keep=node)
+                return
+            # The evicted images may still be on screen or in a result
+            # queue, so they are not closed here; the last reference frees them.
+            while self._nodes and (len(self._nodes) >= self.capacity or self._over_budget(nbytes)):
+                self._evict_one()
+            node = _CacheNode(key, value, nbytes)
+            node.older = self._head
+            if self._head is not None:
+                self._head.newer = node
             else:
-                if len(self.cache) >= self.capacity:
-                    # Remove oldest entry
-                    evicted_key, evicted_image = self.cache.popitem(last=False)
-                    try:
-                        # Close evicted image to free memory
-                        if hasattr(evicted_image, 'close'):
-                            evicted_image.close()
-                    except Exception:
-                        pass
-                self.cache[key] = value
+                self._tail = node
+            self._head = node
+            self._nodes[key] = node
+            self._bytes += nbytes
+
+    def get_failure(self, key: tuple) -> Optional[str]:
+        """Returns the error message recorded for key, or None."""
+        return self._failures.get(key)
+
+    def put_failure(self, key: tuple, error_message: str):
+        with self._lock:
+            self._failures[key] = error_message
+            if len(self._failures) > self.MAX_FAILURES:
+                self._failures.popitem(last=False)
+
+    def clear_failures(self):
+        """Forgets recorded failures, e.g. after archives may have been rewritten."""
+        with self._lock:
+            self._failures.clear()
 
     def clear(self):
         with self._lock:
-            self.cache.clear()
+            self._nodes.clear()
+            self._head = self._tail = self._hand = None
+            self._bytes = 0
+            self._failures.clear()
+
+    def shrink_to(self, target: int):
+        """Evicts entries, coldest first, until at most target remain.
+        Capacity is unchanged, so the cache refills as images are used."""
+        with self._lock:
+            while len(self._nodes) > max(target, 0):
+                self._evict_one()
 
-    def resize(self, new_capacity: int):
+    def resize(self, new_capacity: int, max_bytes: Optional[int] = None):
+        """Sets a new entry capacity and, if given, a new byte budget."""
         if new_capacity <= 0:
             raise ValueError("Cache capacity must be positive.")
         with self._lock:
             self.capacity = new_capacity
-            while len(self.cache) > self.capacity:
-                self.cache.popitem(last=False)
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            while self._nodes and (len(self._nodes) > self.capacity or self._over_budget()):
+                self._evict_one()
 
     def __len__(self) -> int:
-        with self._lock:
-            return len(self.cache)
+        return len(self._nodes)
 
     def __contains__(self, key: tuple) -> bool:
-        with self._lock:
-            return key in self.cache
+        # Membership is a peek: no lock and no visited bit, so existence
+        # checks do not keep entries alive.
+        return key in self._nodes
 
 
 class ZipFileManager:
@@ -93,70 +249,149 @@ class ZipFileManager:
         self._open_files: OrderedDict = OrderedDict()
         self._lock = threading.Lock()
         self._max_open_files = max_open_files
-        if RUST_AVAILABLE:
-            self.image_processor = ImageProcessorRust()
+        # Handles checked out through open(), and evicted handles whose close
+        # is deferred until the last of those blocks exits.
+        self._in_use: Dict[zipfile.ZipFile, int] = {}
+        self._retired: Dict[zipfile.ZipFile, str] = {}
+
+    @contextmanager
+    def open(self, path: str):
+        """
+        Yields the shared ZipFile for path, or None if it cannot be opened.
+        The handle stays open until the block exits even if the pool evicts
+        it in the meantime.
+        """
+        with self._lock:
+            zf = self._get_locked(path)
+            if zf is not None:
+                self._in_use[zf] = self._in_use.get(zf, 0) + 1
+        try:
+            yield zf
+        finally:
+            if zf is not None:
+                self._release(zf)
 
     def get_zipfile(self, path: str):
-        """Gets or opens a ZipFile object for the given path."""
-        import zipfile
-        abs_path = os.path.abspath(path)
+        """Gets or opens a ZipFile object for the given path.
+
+        The handle is shared by every thread so the central directory is
+        parsed once per archive. Callers must not close it; use
+        close_zipfile() or close_all() instead. Prefer open() when reading
+        members, so eviction cannot close the handle mid-read.
+        """
         with self._lock:
-            if abs_path in self._open_files:
-                zf = self._open_files.pop(abs_path)
+            return self._get_locked(path)
+
+    def _get_locked(self, path: str):
+        abs_path = os.path.abspath(path)
+        zf = self._open_files.pop(abs_path, None)
+        if zf is not None:
+            if zf.fp is not None:
                 # Move to end to mark as most recently used
                 self._open_files[abs_path] = zf
                 return zf
-            try:
-                if not os.path.exists(abs_path):
-                    print(f"ZipManager Warning: File not found at {abs_path}")
-                    return None
-                zf = zipfile.ZipFile(path, 'r')
-                self._open_files[abs_path] = zf
+            # Closed behind our back; fall through and reopen it.
+        try:
+            if not os.path.exists(abs_path):
+                logger.warning("ZipManager: file not found at %s", abs_path)
+                return None
+            zf = zipfile.ZipFile(path, 'r')
+            self._open_files[abs_path] = zf
 
-                # Enforce LRU capacity
-                if len(self._open_files) > self._max_open_files:
-                    oldest_path, oldest_zf = self._open_files.popitem(last=False)
-                    try:
-                        oldest_zf.close()
-                    except Exception as e:
-                        print(f"ZipManager Warning: Error closing {oldest_path} during eviction: {e}")
+            # Enforce LRU capacity
+            if len(self._open_files) > self._max_open_files:
+                oldest_path, oldest_zf = self._open_files.popitem(last=False)
+                self._close_locked(oldest_zf, oldest_path, " during eviction")
 
-                return zf
-            except (FileNotFoundError, zipfile.BadZipFile, IsADirectoryError, PermissionError) as e:
-                print(f"ZipManager Error: Failed to open {path}: {e}")
-                if abs_path in self._open_files:
-                    del self._open_files[abs_path]
-                return None
-            except Exception as e:
-                print(f"ZipManager Error: Unexpected error opening {path}: {e}")
-                if abs_path in self._open_files:
-                    del self._open_files[abs_path]
-                return None
+            return zf
+        except (FileNotFoundError, zipfile.BadZipFile, IsADirectoryError, PermissionError) as e:
+            logger.error("ZipManager: failed to open %s: %s", path, e)
+            if abs_path in self._open_files:
+                del self._open_files[abs_path]
+            return None
+        except Exception:
+            logger.exception("ZipManager: unexpected error opening %s", path)
+            if abs_path in self._open_files:
+                del self._open_files[abs_path]
+            return None
+
+    def _release(self, zf: zipfile.ZipFile):
+        with self._lock:
+            remaining = self._in_use.pop(zf) - 1
+            if remaining:
+                self._in_use[zf] = remaining
+                return
+            retired_path = self._retired.pop(zf, None)
+            if retired_path is not None:
+                self._close_locked(zf, retired_path, " after eviction")
+
+    def _close_locked(self, zf: zipfile.ZipFile, path: str, context: str = ""):
+        if zf in self._in_use:
+            self._retired[zf] = path
+            return
+        try:
+            zf.close()
+        except Exception as e:
+            logger.warning("ZipManager: error closing %s%s: %s", path, context, e)
 
     def close_zipfile(self, path: str):
         abs_path = os.path.abspath(path)
         with self._lock:
-            if abs_path in self._open_files:
-                try:
-                    zf = self._open_files.pop(abs_path)
-                    zf.close()
-                except Exception as e:
-                    print(f"ZipManager Warning: Error closing {path}: {e}")
+            zf = self._open_files.pop(abs_path, None)
+            if zf is not None:
+                self._close_locked(zf, path)
 
     def close_all(self):
         with self._lock:
             while self._open_files:
                 abs_path, zf = self._open_files.popitem(last=False)
-                try:
-                    zf.close()
-                except Exception as e:
-                    print(f"ZipManager Warning: Error closing {abs_path} during close_all: {e}")
+                self._close_locked(zf, abs_path, " during close_all")
 
 
 class ZipScanner:
-    """ZIP file analysis with Rust acceleration."""
-    def __init__(self):
+    """ZIP file analysis with Rust acceleration.
+
+    Results are memoized per (path, mtime_ns, size, collect_members), so an
+    archive that has not changed on disk is analyzed once; a rewritten file
+    stats differently and misses. Only successful analyses and definite
+    "not an image archive" verdicts are memoized; an archive that could not
+    be opened or read (too many open files, permissions, a partial copy) is
+    analyzed again next time.
+    """
+    MAX_ANALYSIS_CACHE = 4096
+
+    def __init__(self, zip_manager: Optional[ZipFileManager] = None):
         self.rust_scanner = ZipScannerRust() if RUST_AVAILABLE else None
+        # Used by the Python fallback when members are collected: those
+        # archives are about to be browsed, so the parsed central directory
+        # is kept in the pool for the image loads that follow.
+        self.zip_manager = zip_manager
+        self._fallback_pool: Optional[ThreadPoolExecutor] = None
+        self._fallback_pool_lock = threading.Lock()
+        self._analysis_cache: OrderedDict = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+
+    def _cached_analysis(self, key: tuple) -> Optional[tuple]:
+        with self._analysis_cache_lock:
+            result = self._analysis_cache.get(key)
+            if result is None:
+                return None
+            self._analysis_cache.move_to_end(key)
+        is_valid, members, *rest = result
+        # Every caller gets its own list; the memo keeps an immutable tuple.
+        return (is_valid, list(members) if members is not None else None, *rest)
+
+    def _store_analysis(self, key: tuple, result: tuple):
+        is_valid, members, *rest = result
+        if members is not None:
+            # Interned, so the memo shares name strings with zip_files (which
+            # interns its copies) instead of keeping duplicates alive.
+            intern = sys.intern
+            result = (is_valid, tuple(intern(member) for member in members), *rest)
+        with self._analysis_cache_lock:
+            self._analysis_cache[key] = result
+            if len(self._analysis_cache) > self.MAX_ANALYSIS_CACHE:
+                self._analysis_cache.popitem(last=False)
 
     def analyze_zip(
         self,
@@ -167,56 +402,93 @@ class ZipScanner:
         Analyzes a ZIP file to determine if it contains *only* image files.
         Uses Rust for performance.
         """
+        try:
+            stat_result = os.stat(zip_path)
+        except OSError:
+            return False, None, None, None, 0
+        key = (zip_path, stat_result.st_mtime_ns, stat_result.st_size, collect_members)
+        result = self._cached_analysis(key)
+        if result is not None:
+            return result
+
         if RUST_AVAILABLE and self.rust_scanner:
-            return self.rust_scanner.analyze_zip(zip_path, collect_members)
-        
-        # Fallback to pure Python if Rust not available
-        import zipfile
-        mod_time: Optional[float] = None
-        file_size: Optional[int] = None
+            result = tuple(self.rust_scanner.analyze_zip(zip_path, collect_members))
+            definitive = self._is_definitive_rust(result)
+        else:
+            result, definitive = self._analyze_zip_python(zip_path, collect_members, stat_result)
+        if definitive:
+            self._store_analysis(key, result)
+        return result
+
+    @staticmethod
+    def _is_definitive_rust(result: tuple) -> bool:
+        """
+        The Rust scanner reports a failed open like an empty archive, so an
+        invalid result is only trusted once images were seen before the
+        disqualifying member.
+        """
+        is_valid, _members, _mod_time, _file_size, image_count = result
+        return is_valid or image_count > 0
+
+    def _analyze_zip_python(
+        self,
+        zip_path: str,
+        collect_members: bool,
+        stat_result: os.stat_result
+    ) -> Tuple[Tuple[bool, Optional[List[str]], Optional[float], Optional[int], int], bool]:
+        """
+        Pure-Python fallback for analyze_zip when Rust is not available.
+        Returns the analysis and whether it is definitive (safe to memoize).
+        """
+        mod_time = stat_result.st_mtime
+        file_size = stat_result.st_size
         image_count: int = 0
         all_image_members: List[str] = []
         is_valid: bool = False
 
         try:
-            if not os.path.exists(zip_path):
-                return False, None, None, None, 0
-            stat_result = os.stat(zip_path)
-            mod_time = stat_result.st_mtime
-            file_size = stat_result.st_size
-
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                member_list = zip_ref.infolist()
+            if collect_members and self.zip_manager is not None:
+                pooled_zip = self.zip_manager.get_zipfile(zip_path)
+                if pooled_zip is None:
+                    return (False, None, mod_time, file_size, 0), False
+                member_list = pooled_zip.infolist()
+            else:
+                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                    member_list = zip_ref.infolist()
 
-                if not member_list:
-                    return False, None, mod_time, file_size, 0
+            if not member_list:
+                return (False, None, mod_time, file_size, 0), True
 
-                contains_only_images: bool = True
-                has_at_least_one_file: bool = False
+            contains_only_images: bool = True
+            has_at_least_one_file: bool = False
 
-                for member_info in member_list:
-                    if member_info.is_dir():
-                        continue
+            for member_info in member_list:
+                if member_info.is_dir():
+                    continue
 
-                    has_at_least_one_file = True
-                    filename = member_info.filename
+                has_at_least_one_file = True
+                filename = member_info.filename
 
-                    if self._is_image_file(filename):
-                        image_count += 1
-                        if collect_members:
-                            all_image_members.append(filename)
-                    else:
-                        contains_only_images = False
-                        all_image_members = []
-                        break
+                if self._is_image_file(filename):
+                    image_count += 1
+                    if collect_members:
+                        all_image_members.append(filename)
+                else:
+                    contains_only_images = False
+                    all_image_members = []
+                    break
 
-                is_valid = has_at_least_one_file and contains_only_images
+            is_valid = has_at_least_one_file and contains_only_images
 
+        except zipfile.BadZipFile as e:
+            logger.warning("Analysis error for %s: %s - %s", zip_path, type(e).__name__, e)
+            return (False, None, mod_time, file_size, image_count), True
         except Exception as e:
-            print(f"Analysis Error: {type(e).__name__} - {e}")
-            return False, None, mod_time, file_size, image_count
+            logger.warning("Analysis error for %s: %s - %s", zip_path, type(e).__name__, e)
+            return (False, None, mod_time, file_size, image_count), False
 
-        return is_valid, all_image_members if (is_valid and collect_members) else None, mod_time, file_size, image_count
+        members = all_image_members if (is_valid and collect_members) else None
+        return (is_valid, members, mod_time, file_size, image_count), True
 
     def batch_analyze_zips(
         self,
@@ -229,24 +501,67 @@ class ZipScanner:
         """
         if RUST_AVAILABLE and self.rust_scanner:
             try:
-                return self.rust_scanner.batch_analyze_zips(zip_paths, collect_members)
+                return self._batch_analyze_rust(zip_paths, collect_members)
             except Exception as e:
-                print(f"Batch analysis error, falling back to sequential: {e}")
+                logger.warning("Batch analysis error, falling back to Python: %s", e)
         
-        # Fallback: sequential processing
-        results = []
-        for zip_path in zip_paths:
-            is_valid, members, mod_time, file_size, image_count = self.analyze_zip(zip_path, collect_members)
-            results.append((zip_path, is_valid, members, mod_time, file_size, image_count))
+        # Fallback: analyze on a thread pool. Opening archives and reading
+        # central directories is mostly I/O, so threads overlap the waits.
+        def analyze(zip_path: str):
+            return (zip_path, *self.analyze_zip(zip_path, collect_members))
+
+        if len(zip_paths) < 2:
+            return [analyze(zip_path) for zip_path in zip_paths]
+        return list(self._get_fallback_pool().map(analyze, zip_paths))
+
+    def _batch_analyze_rust(
+        self,
+        zip_paths: List[str],
+        collect_members: bool
+    ) -> List[Tuple[str, bool, Optional[List[str]], Optional[float], Optional[int], int]]:
+        """Serves unchanged archives from the memo; only the rest go to Rust."""
+        results: List[Optional[tuple]] = [None] * len(zip_paths)
+        misses: List[Tuple[int, tuple]] = []
+        for index, zip_path in enumerate(zip_paths):
+            try:
+                stat_result = os.stat(zip_path)
+            except OSError:
+                results[index] = (zip_path, False, None, None, None, 0)
+                continue
+            key = (zip_path, stat_result.st_mtime_ns, stat_result.st_size, collect_members)
+            cached = self._cached_analysis(key)
+            if cached is None:
+                misses.append((index, key))
+            else:
+                results[index] = (zip_path, *cached)
+        if misses:
+            fresh = self.rust_scanner.batch_analyze_zips(
+                [zip_paths[index] for index, _ in misses], collect_members
+            )
+            for (index, key), row in zip(misses, fresh):
+                row = tuple(row)
+                if self._is_definitive_rust(row[1:]):
+                    self._store_analysis(key, row[1:])
+                results[index] = row
         return results
 
+    def _get_fallback_pool(self) -> ThreadPoolExecutor:
+        with self._fallback_pool_lock:
+            if self._fallback_pool is None:
+                self._fallback_pool = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 2),
+                    thread_name_prefix="zip-scan",
+                )
+            return self._fallback_pool
+
     @staticmethod
     def _is_image_file(filename: str) -> bool:
-        IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.ico'}
-        if not filename or filename.endswith('/'):
-            return False
-        _root, ext = os.path.splitext(filename)
-        return ext.lower() in IMAGE_EXTENSIONS
+        lowered = filename.lower()
+        if lowered.endswith(_IMAGE_SUFFIXES_4):
+            return lowered[-5:-4] not in ("", "/")
+        if lowered.endswith(_IMAGE_SUFFIXES_5):
+            return lowered[-6:-5] not in ("", "/")
+        return False
 
 
 class LoadResult:
@@ -278,82 +593,214 @@ def load_image_data_async(
 ):
     """
     Asynchronously loads image data from a ZIP archive member.
+
+    Full-size loads (target_size None) cache the original under cache_key.
+    Sized loads cache only the image resized for target_size, under
+    cache_key + target_size; a decoded original can be tens of megabytes,
+    so previews and thumbnails never park one in the cache.
     """
     if not force_reload:
-        cached_image = cache.get(cache_key)
+        cached_image = _get_cached_image(cache, cache_key, target_size, performance_mode)
         if cached_image is not None:
-            try:
-                if target_size:
-                    img_to_process = cached_image.copy()
-                    resampling_method = (
-                        Image.Resampling.NEAREST if performance_mode
-                        else Image.Resampling.LANCZOS
-                    )
-                    img_to_process.thumbnail(target_size, resampling_method)
-                    result_queue.put(LoadResult(success=True, data=img_to_process, cache_key=cache_key))
-                else:
-                    # Return the cached image directly if no resizing needed
-                    result_queue.put(LoadResult(success=True, data=cached_image, cache_key=cache_key))
-                return
-            except Exception as e:
-                print(f"Async Load Warning: Error processing cached image for {cache_key}: {e}")
+            result_queue.put(LoadResult(success=True, data=cached_image, cache_key=cache_key))
+            return
+        known_failure = cache.get_failure(cache_key)
+        if known_failure is not None:
+            result_queue.put(LoadResult(success=False, error_message=known_failure, cache_key=cache_key))
+            return
+
+    with zip_manager.open(zip_path) as zf:
+        if zf is None:
+            result_queue.put(LoadResult(success=False, error_message="Cannot open ZIP", cache_key=cache_key))
+            return
 
-    zf = zip_manager.get_zipfile(zip_path)
-    if zf is None:
-        result_queue.put(LoadResult(success=False, error_message="Cannot open ZIP", cache_key=cache_key))
-        return
+        try:
+            member_info = zf.getinfo(member_name)
 
-    try:
-        member_info = zf.getinfo(member_name)
+            if member_info.file_size == 0:
+                cache.put_failure(cache_key, "Image file empty")
+                result_queue.put(LoadResult(success=False, error_message="Image file empty", cache_key=cache_key))
+                return
+            if member_info.file_size > max_load_size:
+                err_msg = f"Too large ({_format_size(member_info.file_size)} > {_format_size(max_load_size)})"
+                result_queue.put(LoadResult(success=False, error_message=err_msg, cache_key=cache_key))
+                return
 
-        if member_info.file_size == 0:
-            result_queue.put(LoadResult(success=False, error_message="Image file empty", cache_key=cache_key))
+            with _open_member_stream(zf, member_info) as image_stream:
+                img = Image.open(image_stream)
+                orientation = img.getexif().get(_EXIF_ORIENTATION_TAG, 1)
+                if target_size and img.format == "JPEG":
+                    _draft_jpeg(img, target_size, orientation)
+                # exif_transpose copies the whole image even when there is nothing
+                # to undo, so only call it for orientations that need a transpose.
+                if orientation in _TRANSPOSED_ORIENTATIONS:
+                    img = ImageOps.exif_transpose(img)
+                img.load()
+
+            if target_size:
+                img_thumb = _resize_to_fit(img, target_size, performance_mode)
+                cache.put(_variant_key(cache_key, target_size), img_thumb)
+                result_queue.put(LoadResult(success=True, data=img_thumb, cache_key=cache_key))
+            else:
+                cache.put(cache_key, img)
+                result_queue.put(LoadResult(success=True, data=img, cache_key=cache_key))
+
+        except KeyError:
+            error_message = f"Member '{member_name}' not found"
+        except UnidentifiedImageError:
+            error_message = "Invalid image format"
+        except Image.DecompressionBombError:
+            error_message = "Decompression Bomb"
+        except MemoryError:
+            # May succeed once other images are released, so not remembered.
+            result_queue.put(LoadResult(success=False, error_message="Out of memory", cache_key=cache_key))
+            return
+        except Exception as e:
+            # Possibly transient (I/O errors, too many open files), so not remembered.
+            logger.warning("Async load failed for %s: %s - %s", cache_key, type(e).__name__, e)
+            error_message = f"Load error: {type(e).__name__}"
+            result_queue.put(LoadResult(success=False, error_message=error_message, cache_key=cache_key))
             return
-        if member_info.file_size > max_load_size:
-            err_msg = f"Too large ({_format_size(member_info.file_size)} > {_format_size(max_load_size)})"
-            result_queue.put(LoadResult(success=False, error_message=err_msg, cache_key=cache_key))
+        else:
             return
+        # The size-limit check above is not recorded: it depends on the caller's
+        # max_load_size, and repeating it is only a getinfo().
+        cache.put_failure(cache_key, error_message)
+        result_queue.put(LoadResult(success=False, error_message=error_message, cache_key=cache_key))
 
-        image_data = zf.read(member_name)
-        with io.BytesIO(image_data) as image_stream:
-            img = ImageOps.exif_transpose(Image.open(image_stream))
-            img.load()
 
-        # Cache the original loaded image
-        cache.put(cache_key, img)
+def _open_member_stream(zf: zipfile.ZipFile, member_info: zipfile.ZipInfo):
+    """
+    Returns a readable stream over a member for decoding.
 
-        # Prepare display image
-        if target_size:
-            resampling_method = (
-                Image.Resampling.NEAREST if performance_mode
-                else Image.Resampling.LANCZOS
-            )
-            img_thumb = img.copy()
-            img_thumb.thumbnail(target_size, resampling_method)
-            result_queue.put(LoadResult(success=True, data=img_thumb, cache_key=cache_key))
-        else:
-            result_queue.put(LoadResult(success=True, data=img, cache_key=cache_key))
-
-    except KeyError:
-        result_queue.put(LoadResult(success=False, error_message=f"Member '{member_name}' not found", cache_key=cache_key))
-    except UnidentifiedImageError:
-        result_queue.put(LoadResult(success=False, error_message="Invalid image format", cache_key=cache_key))
-    except Image.DecompressionBombError:
-        result_queue.put(LoadResult(success=False, error_message="Decompression Bomb", cache_key=cache_key))
-    except MemoryError:
-        result_queue.put(LoadResult(success=False, error_message="Out of memory", cache_key=cache_key))
+    Stored members and JPEGs (which PIL reads front to back) are decoded
+    straight from zf.open(), so the compressed file is not held in memory
+    alongside the pixels. Other compressed members are read into a BytesIO
+    first: formats such as TIFF seek backwards, and every backward seek on
+    an inflating stream restarts decompression from the top.
+    """
+    if (member_info.compress_type == zipfile.ZIP_STORED
+            or member_info.filename.lower().endswith(_SEQUENTIAL_SUFFIXES)):
+        return zf.open(member_info)
+    return io.BytesIO(zf.read(member_info))
+
+
+def _variant_key(cache_key: tuple, target_size: Tuple[int, int]) -> tuple:
+    """Cache key for an image resized to fit target_size.
+
+    Flat (path, member, width, height) rather than nesting the size tuple,
+    so hashing the key does not recurse into a second tuple.
+    """
+    return cache_key + target_size
+
+
+def _get_cached_image(
+    cache: LRUCache,
+    cache_key: tuple,
+    target_size: Optional[Tuple[int, int]],
+    performance_mode: bool
+) -> Optional[Image.Image]:
+    """
+    Returns the cached image for a request, or None. Sized requests check
+    their variant first and otherwise derive (and cache) it from a cached
+    original. Returned images are shared and must not be mutated.
+    """
+    if not target_size:
+        return cache.get(cache_key)
+    variant_key = _variant_key(cache_key, target_size)
+    cached_variant = cache.get(variant_key)
+    if cached_variant is not None:
+        return cached_variant
+    cached_image = cache.get(cache_key)
+    if cached_image is None:
+        return None
+    try:
+        cached_variant = _resize_to_fit(cached_image, target_size, performance_mode)
     except Exception as e:
-        print(f"Async Load Error: Failed processing {cache_key}: {type(e).__name__} - {e}")
-        result_queue.put(LoadResult(success=False, error_message=f"Load error: {type(e).__name__}", cache_key=cache_key))
+        logger.warning("Async load: error resizing cached image for %s: %s", cache_key, e)
+        return None
+    if cached_variant is not cached_image:
+        cache.put(variant_key, cached_variant)
+    return cached_variant
+
+
+def _draft_jpeg(img: Image.Image, target_size: Tuple[int, int], orientation: int = 1) -> bool:
+    """
+    Asks libjpeg to decode at 1/2, 1/4 or 1/8 scale while the result still
+    covers target_size. Must run before load(). Returns True if the decode
+    size was reduced.
+    """
+    # exif_transpose runs after the draft, so a 90-degree orientation swaps
+    # which source axis ends up as the width.
+    if orientation in (5, 6, 7, 8):
+        target_size = (target_size[1], target_size[0])
+    original_size = img.size
+    img.draft(img.mode, target_size)
+    return img.size != original_size
+
+
+def _fit_size(source_size: Tuple[int, int], box_size: Tuple[int, int]) -> Tuple[int, int]:
+    """Returns source_size scaled down to fit box_size, keeping the aspect ratio (never upscales)."""
+    width, height = source_size
+    box_width, box_height = box_size
+    if width <= box_width and height <= box_height:
+        return source_size
+    scale = min(box_width / width, box_height / height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _resize_to_fit(
+    img: Image.Image,
+    target_size: Tuple[int, int],
+    performance_mode: bool
+) -> Image.Image:
+    """
+    Returns img scaled to fit target_size. Unlike copy() + thumbnail(), the
+    source is resampled straight into the output buffer, so the shared
+    (cached) original is never duplicated at full size. An image that
+    already fits is returned as-is; callers treat results as read-only.
+    """
+    size = _fit_size(img.size, target_size)
+    if size == img.size:
+        return img
+    resampling_method = _select_resample(img.size, target_size, performance_mode)
+    # reducing_gap makes resize() box-reduce by an integer factor first and
+    # run the real filter only over the last reducing_gap times the target.
+    # Performance mode lets the cheap reduce do nearly all of the work.
+    reducing_gap = 1.0 if performance_mode else 2.0
+    return img.resize(size, resampling_method, reducing_gap=reducing_gap)
+
+
+def _select_resample(
+    source_size: Tuple[int, int],
+    target_size: Tuple[int, int],
+    performance_mode: bool
+) -> int:
+    """
+    Picks a resampling filter for shrinking source_size into target_size.
+    LANCZOS only pays off for mild reductions; for large ratios the cheaper
+    BILINEAR/BOX filters give comparable previews in a fraction of the time.
+    Performance mode uses NEAREST, or BILINEAR when pillow-simd is present.
+    """
+    if performance_mode:
+        return Image.Resampling.BILINEAR if PILLOW_SIMD else Image.Resampling.NEAREST
+    ratio = max(source_size[0] / target_size[0], source_size[1] / target_size[1])
+    if ratio > 4:
+        return Image.Resampling.BOX
+    if ratio > 2:
+        return Image.Resampling.BILINEAR
+    return Image.Resampling.LANCZOS
+
+
+_SIZE_UNITS = ((1, "B"), (1024, "KB"), (1024**2, "MB"), (1024**3, "GB"))
+# Index into _SIZE_UNITS by size.bit_length(): 1024 is the first 11-bit value.
+_SIZE_UNIT_FOR_BIT_LENGTH = (0,) * 11 + (1,) * 10 + (2,) * 10 + (3,) * 34
 
 
 def _format_size(size_bytes: int) -> str:
     """Formats byte size into a human-readable string."""
-    if size_bytes < 1024:
+    unit_index = _SIZE_UNIT_FOR_BIT_LENGTH[min(size_bytes.bit_length(), 64)]
+    if unit_index == 0:
         return f"{size_bytes} B"
-    elif size_bytes < 1024**2:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024**3:
-        return f"{size_bytes / 1024**2:.1f} MB"
-    else:
-        return f"{size_bytes / 1024**3:.1f} GB"
+    divisor, unit = _SIZE_UNITS[unit_index]
+    return f"{size_bytes / divisor:.1f} {unit}"
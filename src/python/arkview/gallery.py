@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import os
 import queue
+import sys
+from collections import deque
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from concurrent.futures import ThreadPoolExecutor
@@ -11,12 +13,22 @@ from concurrent.futures import ThreadPoolExecutor
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from .core import LRUCache, ZipFileManager, load_image_data_async, _format_size
-from .qtcommon import PreviewLabel, pil_image_to_qpixmap
+from .qtcommon import (
+    LARGE_TITLE_QSS,
+    PreviewLabel,
+    drain_queue,
+    format_datetime,
+    pil_image_to_qpixmap,
+    show_preview_result,
+)
 
 
 class GalleryView(QtWidgets.QWidget):
     """Grid-based gallery with preview navigation."""
 
+    # Emitted from worker threads once an album's member list is known.
+    _members_loaded = QtCore.Signal(str, object, object, int)
+
     def __init__(
         self,
         parent: QtWidgets.QWidget,
@@ -29,11 +41,13 @@ class GalleryView(QtWidgets.QWidget):
         ensure_members_loaded_callback: Callable[[str], Optional[List[str]]],
         selection_callback: Optional[Callable[[str, List[str], int], None]] = None,
         open_viewer_callback: Optional[Callable[[str, List[str], int], None]] = None,
+        thumbnail_cache: Optional[LRUCache] = None,
     ):
         super().__init__(parent)
         self.zip_files = zip_files
         self.app_settings = app_settings
         self.cache = cache
+        self.thumbnail_cache = thumbnail_cache if thumbnail_cache is not None else cache
         self.thread_pool = thread_pool
         self.zip_manager = zip_manager
         self.config = config
@@ -43,14 +57,22 @@ class GalleryView(QtWidgets.QWidget):
 
         self.thumbnail_queue: queue.Queue = queue.Queue()
         self.preview_queue: queue.Queue = queue.Queue()
-        self.thumbnail_requests: Dict[tuple, QtWidgets.QListWidgetItem] = {}
+        # Covers being decoded: cache key -> (item, populate() generation).
+        # Kept across populate() so a repopulate does not decode them twice.
+        self.thumbnail_requests: Dict[tuple, Tuple[QtWidgets.QListWidgetItem, int]] = {}
+        # Albums waiting for a cover. Only GALLERY_MAX_PENDING_THUMBNAILS are
+        # handed to the shared pool at a time so a large gallery cannot queue
+        # thousands of tasks ahead of preview and viewer loads.
+        self._pending_albums: deque = deque()
+        self._thumbnails_in_flight = 0
+        self._thumbnail_generation = 0
+        self._members_loaded.connect(self._on_members_loaded)
 
         self.current_zip: Optional[str] = None
         self.current_members: Optional[List[str]] = None
         self.current_index: int = 0
         self.preview_future = None
         self.preview_cache_key: Optional[tuple] = None
-        self.preview_pixmap: Optional[QtGui.QPixmap] = None
         self._thumbnail_timer_active = False
         self._preview_timer_active = False
 
@@ -67,7 +89,7 @@ class GalleryView(QtWidgets.QWidget):
 
         header_layout = QtWidgets.QHBoxLayout()
         title = QtWidgets.QLabel("🎞️ Gallery")
-        title.setStyleSheet("font-weight: bold; font-size: 16px;")
+        title.setStyleSheet(LARGE_TITLE_QSS)
         header_layout.addWidget(title)
         header_layout.addStretch(1)
         self.album_count_label = QtWidgets.QLabel("")
@@ -100,6 +122,16 @@ class GalleryView(QtWidgets.QWidget):
         self.album_list.itemDoubleClicked.connect(self._handle_double_click)
         left_layout.addWidget(self.album_list, 1)
 
+        # Once scrolling settles, queued covers that came into view jump ahead
+        # of the ones that scrolled past.
+        self._visible_covers_timer = QtCore.QTimer(self)
+        self._visible_covers_timer.setSingleShot(True)
+        self._visible_covers_timer.setInterval(60)
+        self._visible_covers_timer.timeout.connect(self._prioritize_visible_albums)
+        self.album_list.verticalScrollBar().valueChanged.connect(
+            lambda _value: self._visible_covers_timer.start()
+        )
+
         splitter.addWidget(left_widget)
 
         # Preview panel --------------------------------------------------
@@ -157,7 +189,8 @@ class GalleryView(QtWidgets.QWidget):
     # ----------------------------------------------------------- Public API
     def populate(self) -> None:
         self.album_list.clear()
-        self.thumbnail_requests.clear()
+        self._pending_albums.clear()
+        self._thumbnail_generation += 1
         self._reset_preview("Tap an album to preview")
 
         zip_paths = list(self.zip_files.keys())
@@ -169,7 +202,8 @@ class GalleryView(QtWidgets.QWidget):
         for zip_path in zip_paths:
             item = self._create_album_item(zip_path)
             self.album_list.addItem(item)
-            self._queue_thumbnail(zip_path, item)
+            self._pending_albums.append((zip_path, item))
+        self._submit_pending_thumbnails()
 
     def handle_keypress(self, event: QtGui.QKeyEvent) -> bool:
         if not self.current_members:
@@ -208,36 +242,76 @@ class GalleryView(QtWidgets.QWidget):
             _, mod_time, file_size, image_count = entry
             tooltip = f"{image_count} images\n{_format_size(file_size)}"
             if mod_time:
-                tooltip += f"\nUpdated: {mod_time:.0f}"
+                tooltip += f"\nUpdated: {format_datetime(mod_time)}"
             item.setToolTip(tooltip)
         return item
 
     # ----------------------------------------------------- Thumbnail loading
-    def _queue_thumbnail(self, zip_path: str, item: QtWidgets.QListWidgetItem) -> None:
-        entry = self.zip_files.get(zip_path)
-        if entry and entry[0]:
-            member = entry[0][0]
-            self._request_thumbnail(zip_path, member, item)
-        else:
-            self.thread_pool.submit(self._load_members_for_thumbnail, zip_path, item)
+    def _submit_pending_thumbnails(self) -> None:
+        limit = self.config["GALLERY_MAX_PENDING_THUMBNAILS"]
+        while self._pending_albums and self._thumbnails_in_flight < limit:
+            zip_path, item = self._pending_albums.popleft()
+            self._thumbnails_in_flight += 1
+            entry = self.zip_files.get(zip_path)
+            if entry and entry[0]:
+                self._request_thumbnail(zip_path, entry[0][0], item)
+            else:
+                self.thread_pool.submit(
+                    self._load_members_for_thumbnail, zip_path, item, self._thumbnail_generation
+                )
 
-    def _load_members_for_thumbnail(self, zip_path: str, item: QtWidgets.QListWidgetItem) -> None:
+    def _prioritize_visible_albums(self) -> None:
+        if not self._pending_albums:
+            return
+        viewport = self.album_list.viewport().rect()
+        visible, offscreen = [], []
+        for pending in self._pending_albums:
+            rect = self.album_list.visualItemRect(pending[1])
+            (visible if rect.intersects(viewport) else offscreen).append(pending)
+        if visible:
+            self._pending_albums.clear()
+            self._pending_albums.extend(visible)
+            self._pending_albums.extend(offscreen)
+
+    def _finish_thumbnail_slot(self) -> None:
+        self._thumbnails_in_flight -= 1
+        self._submit_pending_thumbnails()
+
+    def _load_members_for_thumbnail(
+        self, zip_path: str, item: QtWidgets.QListWidgetItem, generation: int
+    ) -> None:
         try:
             members = self.ensure_members_loaded(zip_path)
         except Exception:
             members = None
-        if members:
-            QtCore.QTimer.singleShot(
-                0, lambda: self._request_thumbnail(zip_path, members[0], item)
-            )
+        self._members_loaded.emit(zip_path, members, item, generation)
+
+    def _on_members_loaded(
+        self,
+        zip_path: str,
+        members: Optional[List[str]],
+        item: QtWidgets.QListWidgetItem,
+        generation: int,
+    ) -> None:
+        if generation != self._thumbnail_generation:
+            # The item belonged to an earlier populate() and is gone.
+            self._finish_thumbnail_slot()
+        elif members:
+            self._request_thumbnail(zip_path, members[0], item)
         else:
-            QtCore.QTimer.singleShot(0, lambda: item.setIcon(self._error_icon))
+            item.setIcon(self._error_icon)
+            self._finish_thumbnail_slot()
 
     def _request_thumbnail(self, zip_path: str, member: str, item: QtWidgets.QListWidgetItem) -> None:
+        """Submits a cover load; the caller has already taken an in-flight slot."""
         cache_key = (zip_path, member)
-        if cache_key in self.thumbnail_requests:
+        already_loading = cache_key in self.thumbnail_requests
+        self.thumbnail_requests[cache_key] = (item, self._thumbnail_generation)
+        if already_loading:
+            # Possibly requested by an earlier populate(); the pending result
+            # is delivered to this item instead.
+            self._finish_thumbnail_slot()
             return
-        self.thumbnail_requests[cache_key] = item
         self.thread_pool.submit(
             load_image_data_async,
             zip_path,
@@ -245,7 +319,7 @@ class GalleryView(QtWidgets.QWidget):
             self.app_settings.get("max_thumbnail_size", self.config["MAX_THUMBNAIL_LOAD_SIZE"]),
             self.config["GALLERY_THUMB_SIZE"],
             self.thumbnail_queue,
-            self.cache,
+            self.thumbnail_cache,
             cache_key,
             self.zip_manager,
             self.app_settings.get("performance_mode", False),
@@ -260,23 +334,30 @@ class GalleryView(QtWidgets.QWidget):
 
     def _process_thumbnail_queue(self) -> None:
         self._thumbnail_timer_active = False
+        # Hoisted out of the per-result loop below.
+        get_result = self.thumbnail_queue.get_nowait
+        pop_request = self.thumbnail_requests.pop
+        generation = self._thumbnail_generation
+        error_icon = self._error_icon
         processed = 0
         while processed < 30:
             try:
-                result = self.thumbnail_queue.get_nowait()
+                result = get_result()
             except queue.Empty:
                 break
-            item = self.thumbnail_requests.pop(result.cache_key, None)
-            if not item:
-                processed += 1
+            processed += 1
+            request = pop_request(result.cache_key, None)
+            if request is None or request[1] != generation:
+                # Its item was removed by a later populate().
                 continue
+            item = request[0]
             if result.success and result.data:
-                pixmap = pil_image_to_qpixmap(result.data)
-                item.setIcon(QtGui.QIcon(pixmap))
+                item.setIcon(QtGui.QIcon(pil_image_to_qpixmap(result.data)))
             else:
-                item.setIcon(self._error_icon)
-            processed += 1
-        if not self.thumbnail_queue.empty():
+                item.setIcon(error_icon)
+        self._thumbnails_in_flight -= processed
+        self._submit_pending_thumbnails()
+        if self._thumbnails_in_flight > 0 or not self.thumbnail_queue.empty():
             self._schedule_thumbnail_poll()
 
     # ------------------------------------------------------- Selection logic
@@ -289,7 +370,9 @@ class GalleryView(QtWidgets.QWidget):
             return
 
         item = selected[0]
-        zip_path = item.data(QtCore.Qt.UserRole)
+        # Qt hands back a fresh str; interning maps it onto the stored path so
+        # the (zip_path, member) keys built from it reuse the cached hash.
+        zip_path = sys.intern(item.data(QtCore.Qt.UserRole))
         entry = self.zip_files.get(zip_path)
         members = entry[0] if entry else None
         if members is None:
@@ -315,7 +398,7 @@ class GalleryView(QtWidgets.QWidget):
             return
         if self.preview_future and not self.preview_future.done():
             self.preview_future.cancel()
-        self._drain_preview_queue()
+        drain_queue(self.preview_queue)
 
         self.current_index = index
         cache_key = (zip_path, members[index])
@@ -340,13 +423,6 @@ class GalleryView(QtWidgets.QWidget):
         )
         self._schedule_preview_poll()
 
-    def _drain_preview_queue(self) -> None:
-        while True:
-            try:
-                self.preview_queue.get_nowait()
-            except queue.Empty:
-                break
-
     def _schedule_preview_poll(self) -> None:
         if self._preview_timer_active:
             return
@@ -360,14 +436,7 @@ class GalleryView(QtWidgets.QWidget):
                 result = self.preview_queue.get_nowait()
                 if result.cache_key != self.preview_cache_key:
                     continue
-                if result.success and result.data:
-                    pixmap = pil_image_to_qpixmap(result.data)
-                    self.preview_pixmap = pixmap
-                    self.preview_label.setPixmap(pixmap)
-                    self.preview_label.setText("")
-                else:
-                    self.preview_label.setText(result.error_message or "Preview failed")
-                    self.preview_label.setPixmap(QtGui.QPixmap())
+                show_preview_result(self.preview_label, result)
                 return
         except queue.Empty:
             if self.preview_future and not self.preview_future.done():
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 import os
 import queue
 import re
 import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -23,13 +24,22 @@ from .core import (
 )
 from .ui import SettingsDialog, ImageViewerWindow
 from .gallery import GalleryView
-from .qtcommon import PreviewLabel, pil_image_to_qpixmap
+from .qtcommon import (
+    HEADER_QSS,
+    PreviewLabel,
+    drain_queue,
+    format_datetime,
+    show_preview_result,
+)
+
+logger = logging.getLogger(__name__)
 
 CONFIG: Dict[str, Any] = {
     "IMAGE_EXTENSIONS": {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.ico'},
     "THUMBNAIL_SIZE": (280, 280),
     "PERFORMANCE_THUMBNAIL_SIZE": (180, 180),
     "GALLERY_THUMB_SIZE": (220, 220),
+    "GALLERY_MAX_PENDING_THUMBNAILS": 8,
     "GALLERY_PREVIEW_SIZE": (480, 480),
     "BATCH_SCAN_SIZE": 50,
     "BATCH_UPDATE_INTERVAL": 20,
@@ -39,6 +49,12 @@ CONFIG: Dict[str, Any] = {
     "PERFORMANCE_MAX_VIEWER_LOAD_SIZE": 30 * 1024 * 1024,
     "CACHE_MAX_ITEMS_NORMAL": 50,
     "CACHE_MAX_ITEMS_PERFORMANCE": 25,
+    # Decoded pixel budget for the main cache; full-size originals vary too
+    # much in size for an item count alone to bound memory.
+    "CACHE_MAX_BYTES_NORMAL": 1024 * 1024 * 1024,
+    "CACHE_MAX_BYTES_PERFORMANCE": 384 * 1024 * 1024,
+    "THUMBNAIL_CACHE_MAX_ITEMS_NORMAL": 30,
+    "THUMBNAIL_CACHE_MAX_ITEMS_PERFORMANCE": 15,
     "WINDOW_SIZE": "1050x750",
     "VIEWER_ZOOM_FACTOR": 1.2,
     "VIEWER_MAX_ZOOM": 10.0,
@@ -48,6 +64,12 @@ CONFIG: Dict[str, Any] = {
     "APP_VERSION": "4.0 - Rust-Python Hybrid",
 }
 
+_EXPLORER_QSS = (
+    'QLabel[role="header"] { font-weight: bold; }'
+    "QListView#archiveList { background-color: #1f2123; color: #f8f9fa; border: 1px solid #2f3336; }"
+    "QListView#archiveList::item:selected { background: #00bc8c; color: #101214; }"
+)
+
 
 def parse_human_size(size_str: str) -> Optional[int]:
     """Parse human-readable size like `10MB` into bytes."""
@@ -66,28 +88,117 @@ def parse_human_size(size_str: str) -> Optional[int]:
     return int(value * multipliers.get(unit, 1))
 
 
-def format_datetime(timestamp: float) -> str:
-    try:
-        return QtCore.QDateTime.fromSecsSinceEpoch(int(timestamp)).toString("yyyy-MM-dd HH:mm:ss")
-    except Exception:
-        return "N/A"
+def _intern_members(members: Optional[List[str]]) -> Optional[List[str]]:
+    """Intern member names so names repeated across archives share one string."""
+    if not members:
+        return members
+    intern = sys.intern
+    return [intern(member) for member in members]
+
+
+def _make_zip_entry(
+    members: Optional[List[str]],
+    mod_time: Optional[float],
+    file_size: Optional[int],
+    image_count: int,
+) -> Tuple[Optional[List[str]], float, int, int]:
+    """Normalize an analysis result into a zip_files entry."""
+    # Member names end up in every cache key; interned strings hash once and
+    # compare by identity.
+    return _intern_members(members), mod_time or 0, file_size or 0, image_count
+
+
+def _iter_zip_files(root: str) -> Iterator[str]:
+    """Yield .zip files under root lazily, without following directory symlinks."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        # DirEntry reuses the d_type from readdir, so most
+                        # entries are classified without an extra stat().
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".zip") and entry.is_file():
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+class ZipListModel(QtCore.QAbstractListModel):
+    """List model over the scanned archives; rows are formatted only when painted."""
+
+    def __init__(
+        self,
+        zip_files: Dict[str, Tuple[Optional[List[str]], float, int, int]],
+        parent: Optional[QtCore.QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._zip_files = zip_files
+        self._paths: List[str] = []
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        zip_path = self._paths[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            entry = self._zip_files.get(zip_path)
+            display_text = os.path.basename(zip_path)
+            if entry and entry[2]:
+                display_text += f" ({_format_size(entry[2])})"
+            return display_text
+        if role == QtCore.Qt.UserRole:
+            return zip_path
+        return None
+
+    def path_at(self, row: int) -> str:
+        return self._paths[row]
+
+    def append_paths(self, paths: List[str]) -> None:
+        if not paths:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(paths) - 1)
+        self._paths.extend(paths)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._paths.clear()
+        self.endResetModel()
 
 
 class MainApp(QtWidgets.QMainWindow):
     """Main Arkview window."""
 
+    # Carries callables from worker threads to the GUI thread (queued connection).
+    _main_thread_call = QtCore.Signal(object)
+
     def __init__(self) -> None:
         super().__init__()
+        self._main_thread_call.connect(self._invoke_main_thread_call)
         self.setWindowTitle(f"Arkview {CONFIG['APP_VERSION']}")
         self.resize(1050, 750)
         self.setMinimumSize(720, 520)
         self.setAcceptDrops(True)
 
-        self.zip_scanner = ZipScanner()
         self.zip_manager = ZipFileManager()
-        self.cache = LRUCache(CONFIG["CACHE_MAX_ITEMS_NORMAL"])
+        self.zip_scanner = ZipScanner(self.zip_manager)
+        self.cache = LRUCache(CONFIG["CACHE_MAX_ITEMS_NORMAL"], CONFIG["CACHE_MAX_BYTES_NORMAL"])
+        # Gallery album covers are requested once per archive; keep that scan
+        # out of the main cache so it cannot flush images being browsed.
+        self.thumbnail_cache = LRUCache(CONFIG["THUMBNAIL_CACHE_MAX_ITEMS_NORMAL"])
         self.preview_queue: queue.Queue = queue.Queue()
         self.thread_pool = ThreadPoolExecutor(max_workers=CONFIG["THREAD_POOL_WORKERS"])
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_application_state_changed)
 
         self.app_settings: Dict[str, Any] = {
             "performance_mode": False,
@@ -99,12 +210,18 @@ class MainApp(QtWidgets.QMainWindow):
         self._apply_settings()
 
         self.zip_files: Dict[str, Tuple[Optional[List[str]], float, int, int]] = {}
+        self._member_load_locks = [threading.Lock() for _ in range(16)]
+        # Bumped whenever the list is cleared or rescanned; background results
+        # tagged with an older generation are dropped.
+        self._scan_generation = 0
+        # Archives whose member lists a neighbour prefetch is reading (GUI thread only).
+        self._members_prefetching: Set[str] = set()
         self.current_selected_zip: Optional[str] = None
         self.current_preview_index: Optional[int] = None
         self.current_preview_members: Optional[List[str]] = None
         self.current_preview_cache_key: Optional[Tuple[str, str]] = None
         self.current_preview_future = None
-        self.preview_pixmap: Optional[QtGui.QPixmap] = None
+        self.details_text: Optional[QtWidgets.QTextEdit] = None
         self._preview_timer_active = False
 
         self.scan_thread: Optional[threading.Thread] = None
@@ -130,7 +247,7 @@ class MainApp(QtWidgets.QMainWindow):
 
         switch_layout = QtWidgets.QHBoxLayout()
         view_label = QtWidgets.QLabel("View:")
-        view_label.setStyleSheet("font-weight: bold;")
+        view_label.setStyleSheet(HEADER_QSS)
         switch_layout.addWidget(view_label)
 
         self.explorer_view_button = QtWidgets.QPushButton("📋 Resource Explorer")
@@ -151,6 +268,11 @@ class MainApp(QtWidgets.QMainWindow):
         self.view_stack.addWidget(self.explorer_view)
         self.view_stack.addWidget(self.gallery_view_container)
         main_layout.addWidget(self.view_stack, 1)
+        # View id -> (page, toggle button); resolved once so switching is a lookup.
+        self._view_widgets: Dict[str, Tuple[QtWidgets.QWidget, QtWidgets.QPushButton]] = {
+            "explorer": (self.explorer_view, self.explorer_view_button),
+            "gallery": (self.gallery_view_container, self.gallery_view_button),
+        }
 
         bottom_widget = QtWidgets.QWidget()
         bottom_layout = QtWidgets.QHBoxLayout(bottom_widget)
@@ -188,6 +310,7 @@ class MainApp(QtWidgets.QMainWindow):
 
     def _build_explorer_view(self) -> QtWidgets.QWidget:
         container = QtWidgets.QWidget()
+        container.setStyleSheet(_EXPLORER_QSS)
         layout = QtWidgets.QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(6)
@@ -198,23 +321,25 @@ class MainApp(QtWidgets.QMainWindow):
         left_widget = QtWidgets.QWidget()
         left_layout = QtWidgets.QVBoxLayout(left_widget)
         left_label = QtWidgets.QLabel("📦 Archives")
-        left_label.setStyleSheet("font-weight: bold;")
+        left_label.setProperty("role", "header")
         left_layout.addWidget(left_label)
 
-        self.zip_list_widget = QtWidgets.QListWidget()
-        self.zip_list_widget.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self.zip_list_widget.itemSelectionChanged.connect(self._on_zip_selected)
-        self.zip_list_widget.setStyleSheet(
-            "QListWidget { background-color: #1f2123; color: #f8f9fa; border: 1px solid #2f3336; }"
-            "QListWidget::item:selected { background: #00bc8c; color: #101214; }"
-        )
-        left_layout.addWidget(self.zip_list_widget, 1)
+        self.zip_list_model = ZipListModel(self.zip_files, self)
+        self.zip_list_view = QtWidgets.QListView()
+        self.zip_list_view.setObjectName("archiveList")
+        self.zip_list_view.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.zip_list_view.setUniformItemSizes(True)
+        self.zip_list_view.setLayoutMode(QtWidgets.QListView.Batched)
+        self.zip_list_view.setBatchSize(64)
+        self.zip_list_view.setModel(self.zip_list_model)
+        self.zip_list_view.selectionModel().selectionChanged.connect(self._on_zip_selected)
+        left_layout.addWidget(self.zip_list_view, 1)
         splitter.addWidget(left_widget)
 
         right_widget = QtWidgets.QWidget()
         right_layout = QtWidgets.QVBoxLayout(right_widget)
         right_label = QtWidgets.QLabel("🖼️  Preview")
-        right_label.setStyleSheet("font-weight: bold;")
+        right_label.setProperty("role", "header")
         right_layout.addWidget(right_label)
 
         nav_layout = QtWidgets.QHBoxLayout()
@@ -238,13 +363,8 @@ class MainApp(QtWidgets.QMainWindow):
         self.preview_label.clicked.connect(self._open_viewer)
         self.preview_label.scrolled.connect(self._on_preview_scroll)
         right_layout.addWidget(self.preview_label, 1)
-
-        details_group = QtWidgets.QGroupBox("ℹ️  Details")
-        details_layout = QtWidgets.QVBoxLayout(details_group)
-        self.details_text = QtWidgets.QTextEdit()
-        self.details_text.setReadOnly(True)
-        details_layout.addWidget(self.details_text)
-        right_layout.addWidget(details_group)
+        # The details panel is built on first selection; see _ensure_details_text.
+        self._preview_panel_layout = right_layout
 
         splitter.addWidget(right_widget)
         splitter.setStretchFactor(0, 1)
@@ -266,6 +386,7 @@ class MainApp(QtWidgets.QMainWindow):
             self._ensure_members_loaded,
             self._on_gallery_selection,
             self._open_viewer_from_gallery,
+            thumbnail_cache=self.thumbnail_cache,
         )
         layout.addWidget(self.gallery_widget)
         return container
@@ -285,10 +406,15 @@ class MainApp(QtWidgets.QMainWindow):
         help_menu = menubar.addMenu("&Help")
         help_menu.addAction("About", self._show_about)
 
+    _SHORTCUTS: Tuple[Tuple[Any, str], ...] = (
+        ("Ctrl+G", "_show_gallery_view"),
+        ("Ctrl+E", "_show_explorer_view"),
+        (QtCore.Qt.Key_Tab, "_handle_tab_switch"),
+    )
+
     def _setup_shortcuts(self) -> None:
-        QtGui.QShortcut(QtGui.QKeySequence("Ctrl+G"), self, activated=lambda: self._switch_view("gallery"))
-        QtGui.QShortcut(QtGui.QKeySequence("Ctrl+E"), self, activated=lambda: self._switch_view("explorer"))
-        QtGui.QShortcut(QtGui.QKeySequence(QtCore.Qt.Key_Tab), self, activated=self._handle_tab_switch)
+        for key, slot_name in self._SHORTCUTS:
+            QtGui.QShortcut(QtGui.QKeySequence(key), self, activated=getattr(self, slot_name))
 
     # ---------------------------------------------------------- Qt events
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
@@ -308,13 +434,43 @@ class MainApp(QtWidgets.QMainWindow):
     def dropEvent(self, event: QtGui.QDropEvent) -> None:
         if not event.mimeData().hasUrls():
             return
-        for url in event.mimeData().urls():
-            if url.isLocalFile():
-                path = url.toLocalFile()
-                if path.lower().endswith(".zip"):
-                    self._add_zip_entry(path)
+        local_files = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        zip_paths = [path for path in local_files if path.lower().endswith(".zip")]
+        if zip_paths:
+            self._set_status(f"Analyzing {len(zip_paths)} dropped archive(s)...")
+            self.thread_pool.submit(self._analyze_dropped_worker, zip_paths)
+
+    def _analyze_dropped_worker(self, zip_paths: List[str]) -> None:
+        # One batch call lets the Rust scanner parse the archives in parallel.
+        try:
+            results = self.zip_scanner.batch_analyze_zips(zip_paths, collect_members=True)
+        except Exception as exc:
+            logger.warning("Drop analysis error: %s", exc)
+            self._run_on_main_thread(self._set_status, "Failed to analyze dropped archives")
+            return
+        entries = {
+            sys.intern(zip_path): _make_zip_entry(members, mod_time, file_size, image_count)
+            for zip_path, is_valid, members, mod_time, file_size, image_count in results
+            if is_valid and members
+        }
+        self._run_on_main_thread(self._merge_dropped_entries, entries, len(zip_paths))
+
+    def _merge_dropped_entries(
+        self,
+        entries: Dict[str, Tuple[Optional[List[str]], float, int, int]],
+        dropped_count: int,
+    ) -> None:
+        # Archives already in the list are skipped by the merge, so count after it.
+        added = self._merge_zip_entries(entries)
+        self._set_status(f"Added {added} of {dropped_count} dropped archives")
 
     # --------------------------------------------------------- View logic
+    def _show_gallery_view(self) -> None:
+        self._switch_view("gallery")
+
+    def _show_explorer_view(self) -> None:
+        self._switch_view("explorer")
+
     def _handle_tab_switch(self) -> None:
         if self.current_view == "explorer":
             self._switch_view("gallery")
@@ -322,9 +478,7 @@ class MainApp(QtWidgets.QMainWindow):
             self._switch_view("explorer")
 
     def _switch_view(self, view: str) -> None:
-        if view not in {"explorer", "gallery"}:
-            return
-        if self.current_view == view:
+        if view not in self._view_widgets or self.current_view == view:
             return
         self.current_view = view
         self._update_view_buttons()
@@ -333,14 +487,12 @@ class MainApp(QtWidgets.QMainWindow):
             self.gallery_widget.populate()
 
     def _update_view_buttons(self) -> None:
-        self.explorer_view_button.setChecked(self.current_view == "explorer")
-        self.gallery_view_button.setChecked(self.current_view == "gallery")
+        current_view = self.current_view
+        for view, (_, button) in self._view_widgets.items():
+            button.setChecked(view == current_view)
 
     def _update_view_visibility(self) -> None:
-        if self.current_view == "explorer":
-            self.view_stack.setCurrentWidget(self.explorer_view)
-        else:
-            self.view_stack.setCurrentWidget(self.gallery_view_container)
+        self.view_stack.setCurrentWidget(self._view_widgets[self.current_view][0])
 
     def _refresh_gallery(self) -> None:
         if self.gallery_widget:
@@ -356,6 +508,10 @@ class MainApp(QtWidgets.QMainWindow):
             return
         self._set_status("Scanning...")
         self.scan_stop_event.clear()
+        self._scan_generation += 1
+        # Rescanned archives may have been rewritten since a member failed.
+        self.cache.clear_failures()
+        self.thumbnail_cache.clear_failures()
         self.scan_thread = threading.Thread(
             target=self._scan_directory_worker,
             args=(directory,),
@@ -365,50 +521,61 @@ class MainApp(QtWidgets.QMainWindow):
 
     def _scan_directory_worker(self, directory: str) -> None:
         try:
-            zip_files = [str(p) for p in Path(directory).glob("**/*.zip")]
-            total_files = len(zip_files)
-            if total_files == 0:
-                self._run_on_main_thread(self._set_status, "No ZIP files found")
-                return
-
             batch_size = max(1, CONFIG["BATCH_SCAN_SIZE"])
             ui_update_interval = max(1, CONFIG["BATCH_UPDATE_INTERVAL"])
-            pending_entries: List[Tuple[str, Optional[List[str]], Optional[float], Optional[int], Optional[int]]] = []
+            # Entries are normalized here, off the GUI thread, so the main
+            # thread only has to merge each batch into zip_files.
+            pending_entries: Dict[str, Tuple[Optional[List[str]], float, int, int]] = {}
             processed = 0
             valid_found = 0
+            next_status_at = ui_update_interval
+            # Hoisted out of the per-archive loop below.
+            analyze_zips = self.zip_scanner.batch_analyze_zips
+            intern = sys.intern
+            make_entry = _make_zip_entry
 
             def flush_pending() -> None:
                 if not pending_entries:
                     return
                 batch = pending_entries.copy()
                 pending_entries.clear()
-                self._run_on_main_thread(self._add_zip_entries_bulk, batch)
+                self._run_on_main_thread(self._merge_zip_entries, batch)
 
-            for start in range(0, total_files, batch_size):
-                if self.scan_stop_event.is_set():
-                    break
-                batch_paths = zip_files[start:start + batch_size]
-                try:
-                    batch_results = self.zip_scanner.batch_analyze_zips(batch_paths, collect_members=False)
-                except Exception as exc:
-                    self._run_on_main_thread(
-                        lambda: QtWidgets.QMessageBox.critical(self, "Error", f"Scan error: {exc}")
-                    )
-                    self._run_on_main_thread(self._set_status, "Scan failed")
-                    return
+            def analyze_batch(batch_paths: List[str]) -> None:
+                nonlocal processed, valid_found, next_status_at
+                batch_results = analyze_zips(batch_paths, collect_members=False)
+                processed += len(batch_results)
                 for zip_path, is_valid, members, mod_time, file_size, image_count in batch_results:
-                    processed += 1
                     if is_valid:
-                        pending_entries.append((zip_path, members, mod_time, file_size, image_count))
+                        pending_entries[intern(zip_path)] = make_entry(
+                            members, mod_time, file_size, image_count
+                        )
                         valid_found += 1
                 if len(pending_entries) >= batch_size:
                     flush_pending()
-                if processed % ui_update_interval == 0 or processed >= total_files:
+                if processed >= next_status_at:
+                    next_status_at = processed + ui_update_interval
                     self._run_on_main_thread(
-                        self._set_status,
-                        f"Scanning... {processed}/{total_files} files processed",
+                        self._set_status, f"Scanning... {processed} files processed"
                     )
 
+            # Discovery and analysis are interleaved: each batch is analyzed as
+            # soon as the walk has produced it instead of listing the tree first.
+            batch_paths: List[str] = []
+            for zip_path in _iter_zip_files(directory):
+                if self.scan_stop_event.is_set():
+                    break
+                batch_paths.append(zip_path)
+                if len(batch_paths) >= batch_size:
+                    analyze_batch(batch_paths)
+                    batch_paths = []
+            if batch_paths and not self.scan_stop_event.is_set():
+                analyze_batch(batch_paths)
+
+            if processed == 0 and not self.scan_stop_event.is_set():
+                self._run_on_main_thread(self._set_status, "No ZIP files found")
+                return
+
             flush_pending()
             final_message = (
                 "Scan canceled" if self.scan_stop_event.is_set()
@@ -416,9 +583,8 @@ class MainApp(QtWidgets.QMainWindow):
             )
             self._run_on_main_thread(self._set_status, final_message)
         except Exception as exc:
-            self._run_on_main_thread(
-                lambda: QtWidgets.QMessageBox.critical(self, "Error", f"Scan error: {exc}")
-            )
+            # Bind the message now: exc is unbound once this block exits.
+            self._run_on_main_thread(QtWidgets.QMessageBox.critical, self, "Error", f"Scan error: {exc}")
             self._run_on_main_thread(self._set_status, "Scan failed")
 
     def _add_zip_file(self) -> None:
@@ -433,7 +599,9 @@ class MainApp(QtWidgets.QMainWindow):
     def _analyze_and_add(self, zip_path: str) -> None:
         is_valid, members, mod_time, file_size, image_count = self.zip_scanner.analyze_zip(zip_path)
         if is_valid and members:
-            self._add_zip_entry(zip_path, members, mod_time, file_size, image_count)
+            self._merge_zip_entries(
+                {sys.intern(zip_path): _make_zip_entry(members, mod_time, file_size, image_count)}
+            )
         else:
             QtWidgets.QMessageBox.warning(
                 self,
@@ -441,66 +609,38 @@ class MainApp(QtWidgets.QMainWindow):
                 f"'{os.path.basename(zip_path)}' does not contain only images.",
             )
 
-    def _add_zip_entry(
-        self,
-        zip_path: str,
-        members: Optional[List[str]] = None,
-        mod_time: Optional[float] = None,
-        file_size: Optional[int] = None,
-        image_count: Optional[int] = None,
-    ) -> None:
-        self._add_zip_entries_bulk([(zip_path, members, mod_time, file_size, image_count)])
-
-    def _add_zip_entries_bulk(
-        self,
-        entries: List[Tuple[str, Optional[List[str]], Optional[float], Optional[int], Optional[int]]],
-    ) -> None:
-        if not entries:
-            return
-        for zip_path, members, mod_time, file_size, image_count in entries:
-            if zip_path in self.zip_files:
-                continue
-            resolved_members = members
-            resolved_mod_time = mod_time
-            resolved_file_size = file_size
-            resolved_image_count = image_count
-
-            if resolved_members is None and resolved_image_count is None:
-                is_valid, resolved_members, resolved_mod_time, resolved_file_size, resolved_image_count = self.zip_scanner.analyze_zip(zip_path)
-                if not is_valid or not resolved_members:
-                    continue
-            elif resolved_members is None and (resolved_mod_time is None or resolved_file_size is None):
-                is_valid, resolved_members, resolved_mod_time, resolved_file_size, resolved_image_count = self.zip_scanner.analyze_zip(zip_path)
-                if not is_valid:
-                    continue
-
-            if resolved_image_count is None:
-                resolved_image_count = len(resolved_members) if resolved_members else 0
-            entry_mod_time = resolved_mod_time or 0
-            entry_file_size = resolved_file_size or 0
-            self.zip_files[zip_path] = (resolved_members, entry_mod_time, entry_file_size, resolved_image_count)
-
-            display_text = os.path.basename(zip_path)
-            if entry_file_size:
-                display_text += f" ({_format_size(entry_file_size)})"
-            item = QtWidgets.QListWidgetItem(display_text)
-            item.setData(QtCore.Qt.UserRole, zip_path)
-            self.zip_list_widget.addItem(item)
+    def _merge_zip_entries(self, entries: Dict[str, Tuple[Optional[List[str]], float, int, int]]) -> int:
+        """Adds already-analyzed entries from a worker in one dict merge.
+        Returns how many were new; paths already listed are skipped."""
+        zip_files = self.zip_files
+        new_entries = {path: entry for path, entry in entries.items() if path not in zip_files}
+        if not new_entries:
+            return 0
+        zip_files.update(new_entries)
+        self.zip_list_model.append_paths(list(new_entries))
         self._refresh_gallery()
+        return len(new_entries)
 
     def _run_on_main_thread(self, func: Callable, *args, **kwargs) -> None:
-        QtCore.QTimer.singleShot(0, lambda: func(*args, **kwargs))
+        # QTimer.singleShot from a worker thread never fires (no event loop there),
+        # so hand the call over through a signal instead.
+        self._main_thread_call.emit(partial(func, *args, **kwargs))
+
+    def _invoke_main_thread_call(self, func: Callable) -> None:
+        func()
 
     # ----------------------------------------------------------- Selection
-    def _on_zip_selected(self) -> None:
-        selected = self.zip_list_widget.selectedItems()
-        if not selected:
+    def _on_zip_selected(self, *_args) -> None:
+        indexes = self.zip_list_view.selectionModel().selectedIndexes()
+        if not indexes:
             self._reset_preview()
             return
-        zip_path = selected[0].data(QtCore.Qt.UserRole)
+        row = indexes[0].row()
+        zip_path = self.zip_list_model.path_at(row)
         if not zip_path:
             self._reset_preview()
             return
+        self._prefetch_adjacent_members(row)
         self.current_selected_zip = zip_path
         entry = self.zip_files.get(zip_path)
         if not entry:
@@ -519,6 +659,47 @@ class MainApp(QtWidgets.QMainWindow):
         self._update_details(zip_path, mod_time, file_size, image_count)
         self._load_preview(zip_path, members, 0)
 
+    def _prefetch_adjacent_members(self, row: int) -> None:
+        """Reads the member lists of the neighbouring rows in the background,
+        so stepping through the list does not parse a central directory on
+        the GUI thread."""
+        for neighbor in (row + 1, row - 1):
+            if not (0 <= neighbor < self.zip_list_model.rowCount()):
+                continue
+            zip_path = self.zip_list_model.path_at(neighbor)
+            entry = self.zip_files.get(zip_path)
+            if entry and entry[0] is None and zip_path not in self._members_prefetching:
+                self._members_prefetching.add(zip_path)
+                self.thread_pool.submit(self._prefetch_members_worker, zip_path, self._scan_generation)
+
+    def _prefetch_members_worker(self, zip_path: str, generation: int) -> None:
+        # Same shard lock as _ensure_members_loaded: selecting the row while
+        # this read runs waits for it, then gets the scanner's memoized result
+        # instead of parsing the central directory a second time.
+        with self._member_load_locks[hash(zip_path) % len(self._member_load_locks)]:
+            is_valid, members, mod_time, file_size, _image_count = self.zip_scanner.analyze_zip(zip_path)
+        members = _intern_members(members) if is_valid and members else None
+        # Always reported back, so the path leaves the in-flight set.
+        self._run_on_main_thread(
+            self._apply_prefetched_members, zip_path, generation, members, mod_time, file_size
+        )
+
+    def _apply_prefetched_members(
+        self,
+        zip_path: str,
+        generation: int,
+        members: Optional[List[str]],
+        mod_time: Optional[float],
+        file_size: Optional[int],
+    ) -> None:
+        self._members_prefetching.discard(zip_path)
+        # The list may have been cleared or rescanned while the worker ran.
+        if not members or generation != self._scan_generation:
+            return
+        entry = self.zip_files.get(zip_path)
+        if entry and entry[0] is None:
+            self.zip_files[zip_path] = (members, mod_time or 0, file_size or 0, len(members))
+
     def _ensure_members_loaded(self, zip_path: str) -> Optional[List[str]]:
         entry = self.zip_files.get(zip_path)
         if not entry:
@@ -526,10 +707,17 @@ class MainApp(QtWidgets.QMainWindow):
         members, mod_time, file_size, image_count = entry
         if members is not None:
             return members
-        is_valid, members, mod_time, file_size, image_count = self.zip_scanner.analyze_zip(zip_path)
-        if is_valid and members:
-            self.zip_files[zip_path] = (members, mod_time or 0, file_size or 0, len(members))
-            return members
+        # Gallery workers and the GUI thread can ask for the same archive at
+        # once; a per-shard lock makes the second caller reuse the first read.
+        with self._member_load_locks[hash(zip_path) % len(self._member_load_locks)]:
+            entry = self.zip_files.get(zip_path)
+            if entry and entry[0] is not None:
+                return entry[0]
+            is_valid, members, mod_time, file_size, image_count = self.zip_scanner.analyze_zip(zip_path)
+            if is_valid and members:
+                members = _intern_members(members)
+                self.zip_files[zip_path] = (members, mod_time or 0, file_size or 0, len(members))
+                return members
         return None
 
     def _update_details(self, zip_path: str, mod_time: float, file_size: int, image_count: int) -> None:
@@ -540,7 +728,17 @@ class MainApp(QtWidgets.QMainWindow):
         ]
         if mod_time:
             details.append(f"Modified: {format_datetime(mod_time)}")
-        self.details_text.setPlainText("\n".join(details))
+        self._ensure_details_text().setPlainText("\n".join(details))
+
+    def _ensure_details_text(self) -> QtWidgets.QTextEdit:
+        if self.details_text is None:
+            details_group = QtWidgets.QGroupBox("ℹ️  Details")
+            details_layout = QtWidgets.QVBoxLayout(details_group)
+            self.details_text = QtWidgets.QTextEdit()
+            self.details_text.setReadOnly(True)
+            details_layout.addWidget(self.details_text)
+            self._preview_panel_layout.addWidget(details_group)
+        return self.details_text
 
     # ----------------------------------------------------------- Preview UI
     def _load_preview(self, zip_path: str, members: List[str], index: int) -> None:
@@ -548,7 +746,7 @@ class MainApp(QtWidgets.QMainWindow):
             return
         if self.current_preview_future and not self.current_preview_future.done():
             self.current_preview_future.cancel()
-        self._drain_preview_queue()
+        drain_queue(self.preview_queue)
 
         self.current_selected_zip = zip_path
         self.current_preview_members = members
@@ -581,13 +779,6 @@ class MainApp(QtWidgets.QMainWindow):
         )
         self._schedule_preview_check()
 
-    def _drain_preview_queue(self) -> None:
-        while True:
-            try:
-                self.preview_queue.get_nowait()
-            except queue.Empty:
-                break
-
     def _schedule_preview_check(self) -> None:
         if self._preview_timer_active:
             return
@@ -604,15 +795,7 @@ class MainApp(QtWidgets.QMainWindow):
                 result = self.preview_queue.get_nowait()
                 if result.cache_key != expected_key:
                     continue
-                if result.success and result.data:
-                    pixmap = pil_image_to_qpixmap(result.data)
-                    self.preview_pixmap = pixmap
-                    self.preview_label.setPixmap(pixmap)
-                    self.preview_label.setText("")
-                else:
-                    message = result.error_message or "Preview failed"
-                    self.preview_label.setText(message)
-                    self.preview_label.setPixmap(QtGui.QPixmap())
+                show_preview_result(self.preview_label, result)
                 return
         except queue.Empty:
             if self.current_preview_future and not self.current_preview_future.done():
@@ -625,7 +808,7 @@ class MainApp(QtWidgets.QMainWindow):
         self.current_preview_members = None
         self.current_preview_index = None
         self.current_preview_cache_key = None
-        self._drain_preview_queue()
+        drain_queue(self.preview_queue)
         self.preview_label.setPixmap(QtGui.QPixmap())
         self.preview_label.setText(message)
         self.preview_info_label.setText("")
@@ -728,18 +911,24 @@ class MainApp(QtWidgets.QMainWindow):
         if self.app_settings.get("performance_mode"):
             self.app_settings["max_thumbnail_size"] = CONFIG["PERFORMANCE_MAX_THUMBNAIL_LOAD_SIZE"]
             self._viewer_max_load = CONFIG["PERFORMANCE_MAX_VIEWER_LOAD_SIZE"]
-            self.cache.resize(CONFIG["CACHE_MAX_ITEMS_PERFORMANCE"])
+            self.cache.resize(CONFIG["CACHE_MAX_ITEMS_PERFORMANCE"], CONFIG["CACHE_MAX_BYTES_PERFORMANCE"])
+            self.thumbnail_cache.resize(CONFIG["THUMBNAIL_CACHE_MAX_ITEMS_PERFORMANCE"])
         else:
             self.app_settings["max_thumbnail_size"] = CONFIG["MAX_THUMBNAIL_LOAD_SIZE"]
             self._viewer_max_load = CONFIG["MAX_VIEWER_LOAD_SIZE"]
-            self.cache.resize(CONFIG["CACHE_MAX_ITEMS_NORMAL"])
+            self.cache.resize(CONFIG["CACHE_MAX_ITEMS_NORMAL"], CONFIG["CACHE_MAX_BYTES_NORMAL"])
+            self.thumbnail_cache.resize(CONFIG["THUMBNAIL_CACHE_MAX_ITEMS_NORMAL"])
 
     def _clear_list(self) -> None:
-        self.zip_list_widget.clear()
+        self.zip_list_model.clear()
         self.zip_files.clear()
+        self._scan_generation += 1
+        self.cache.clear_failures()
+        self.thumbnail_cache.clear_failures()
         self.current_selected_zip = None
         self._reset_preview()
-        self.details_text.clear()
+        if self.details_text is not None:
+            self.details_text.clear()
         self._refresh_gallery()
 
     def _show_about(self) -> None:
@@ -754,6 +943,13 @@ BSD-2-Clause License"""
         QtWidgets.QMessageBox.about(self, "About Arkview", about_text)
 
     # -------------------------------------------------------------- Closing
+    def _on_application_state_changed(self, state: QtCore.Qt.ApplicationState) -> None:
+        # While hidden or suspended, give back most of the decoded images but
+        # keep the most recently useful quarter for when the user returns.
+        if state in (QtCore.Qt.ApplicationHidden, QtCore.Qt.ApplicationSuspended):
+            self.cache.shrink_to(self.cache.capacity // 4)
+            self.thumbnail_cache.shrink_to(self.thumbnail_cache.capacity // 4)
+
     def _on_closing(self) -> None:
         self.scan_stop_event.set()
         if self.scan_thread and self.scan_thread.is_alive():
@@ -2,20 +2,76 @@
 
 from __future__ import annotations
 
-from PIL import Image, ImageQt
+import queue
+from functools import lru_cache
+
+from PIL import Image
 from PySide6 import QtCore, QtGui, QtWidgets
 
+# Shared stylesheet fragments, built once at import time.
+HEADER_QSS = "font-weight: bold;"
+TITLE_QSS = HEADER_QSS + " font-size: 14px;"
+LARGE_TITLE_QSS = HEADER_QSS + " font-size: 16px;"
+_PREVIEW_QSS = "background-color: #2a2d2e; color: #f8f9fa; border: 1px solid #3c3f41;"
+
+
+@lru_cache(maxsize=4096)
+def _format_epoch_seconds(seconds: int) -> str:
+    return QtCore.QDateTime.fromSecsSinceEpoch(seconds).toString("yyyy-MM-dd HH:mm:ss")
+
+
+def format_datetime(timestamp: float) -> str:
+    """Format a POSIX timestamp for display, memoized per whole second."""
+    try:
+        return _format_epoch_seconds(int(timestamp))
+    except Exception:
+        return "N/A"
+
+
+# Modes with an alpha band. Checking getbands() for "A" would also match the
+# A (a*) channel of LAB.
+_ALPHA_MODES = frozenset(("RGBA", "RGBa", "LA", "La", "PA"))
+
 
 def pil_image_to_qpixmap(image: Image.Image) -> QtGui.QPixmap:
     """Convert a PIL Image into a QPixmap suitable for display."""
-    if image.mode not in ("RGB", "RGBA", "L", "LA"):
-        image = image.convert("RGBA")
-    elif image.mode in ("L", "LA"):
-        image = image.convert("RGBA")
-    qt_image = ImageQt.ImageQt(image)
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = image.mode in _ALPHA_MODES or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+    if image.mode == "RGB":
+        data = image.tobytes("raw", "RGB")
+        bytes_per_line, qt_format = image.width * 3, QtGui.QImage.Format_RGB888
+        pixmap_format = QtGui.QImage.Format_RGB32
+    else:
+        data = image.tobytes("raw", "RGBA")
+        bytes_per_line, qt_format = image.width * 4, QtGui.QImage.Format_RGBA8888
+        pixmap_format = QtGui.QImage.Format_ARGB32_Premultiplied
+    # Converting straight to the pixmap's native format both detaches the
+    # QImage from the Python buffer and spares fromImage() a second pass.
+    qt_image = QtGui.QImage(data, image.width, image.height, bytes_per_line, qt_format)
+    qt_image = qt_image.convertToFormat(pixmap_format)
     return QtGui.QPixmap.fromImage(qt_image)
 
 
+def drain_queue(pending: queue.Queue) -> None:
+    """Discard every result currently waiting in a load queue."""
+    while True:
+        try:
+            pending.get_nowait()
+        except queue.Empty:
+            return
+
+
+def show_preview_result(label: QtWidgets.QLabel, result) -> None:
+    """Display a LoadResult on a preview label, or its error message."""
+    if result.success and result.data:
+        label.setPixmap(pil_image_to_qpixmap(result.data))
+        label.setText("")
+    else:
+        label.setText(result.error_message or "Preview failed")
+        label.setPixmap(QtGui.QPixmap())
+
+
 class PreviewLabel(QtWidgets.QLabel):
     """Clickable label that also emits scroll events for preview navigation."""
 
@@ -27,9 +83,7 @@ class PreviewLabel(QtWidgets.QLabel):
         self.setAlignment(QtCore.Qt.AlignCenter)
         self.setTextInteractionFlags(QtCore.Qt.NoTextInteraction)
         self.setMinimumHeight(220)
-        self.setStyleSheet(
-            "background-color: #2a2d2e; color: #f8f9fa; border: 1px solid #3c3f41;"
-        )
+        self.setStyleSheet(_PREVIEW_QSS)
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         if event.button() == QtCore.Qt.LeftButton:
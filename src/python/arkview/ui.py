@@ -5,13 +5,15 @@ from __future__ import annotations
 import os
 import queue
 from typing import Any, Dict, List, Optional
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from PIL import Image
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from .core import LRUCache, ZipFileManager, load_image_data_async
-from .qtcommon import pil_image_to_qpixmap
+from .qtcommon import TITLE_QSS, drain_queue, pil_image_to_qpixmap
+
+_VIEWER_IMAGE_QSS = "background-color: #1c1e1f; border: 1px solid #3c3f41;"
 
 
 class SettingsDialog(QtWidgets.QDialog):
@@ -27,7 +29,7 @@ class SettingsDialog(QtWidgets.QDialog):
 
         main_layout = QtWidgets.QVBoxLayout(self)
         title = QtWidgets.QLabel("Application Settings")
-        title.setStyleSheet("font-weight: bold; font-size: 14px;")
+        title.setStyleSheet(TITLE_QSS)
         main_layout.addWidget(title)
 
         self.performance_checkbox = QtWidgets.QCheckBox(
@@ -110,16 +112,27 @@ class ImageViewerWindow(QtWidgets.QDialog):
         self.current_index = max(0, min(initial_index, len(image_members) - 1))
         self.current_pil_image: Optional[Image.Image] = None
         self._current_pixmap: Optional[QtGui.QPixmap] = None
+        self._full_pixmap: Optional[QtGui.QPixmap] = None
         self._current_cache_key: Optional[tuple] = None
         self._load_future = None
+        self._prefetch_queue: queue.Queue = queue.Queue()
+        self._prefetch_futures: Dict[int, Future] = {}
         self._result_timer_active = False
         self._is_loading = False
         self._is_fullscreen = False
+        self._closed = False
         self.zoom_factor = 1.0
         self.fit_to_window = True
 
+        # Coalesce bursts of resize events into a single re-render.
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(40)
+        self._resize_timer.timeout.connect(self._update_display)
+
         self._setup_ui()
-        QtCore.QTimer.singleShot(0, lambda: self.load_image(self.current_index))
+        # Submit the first decode now so it overlaps with the dialog being shown.
+        self.load_image(self.current_index)
 
     def _setup_ui(self) -> None:
         layout = QtWidgets.QVBoxLayout(self)
@@ -140,7 +153,7 @@ class ImageViewerWindow(QtWidgets.QDialog):
 
         self.image_label = QtWidgets.QLabel()
         self.image_label.setAlignment(QtCore.Qt.AlignCenter)
-        self.image_label.setStyleSheet("background-color: #1c1e1f; border: 1px solid #3c3f41;")
+        self.image_label.setStyleSheet(_VIEWER_IMAGE_QSS)
         layout.addWidget(self.image_label, 1)
 
         self.status_label = QtWidgets.QLabel("")
@@ -173,13 +186,14 @@ class ImageViewerWindow(QtWidgets.QDialog):
         self._is_loading = True
         self.status_label.setText("Loading image...")
         self._drain_queue()
+        self._cancel_prefetches(keep_around=index)
 
         cache_key = (self.zip_path, self.image_members[index])
         self._current_cache_key = cache_key
         self.fit_to_window = True
         self.zoom_factor = 1.0
 
-        self._load_future = self.thread_pool.submit(
+        load_args = (
             load_image_data_async,
             self.zip_path,
             self.image_members[index],
@@ -191,14 +205,77 @@ class ImageViewerWindow(QtWidgets.QDialog):
             self.zip_manager,
             self.settings.get("performance_mode", False),
         )
+        prefetch = self._prefetch_futures.pop(index, None)
+        if prefetch is not None and prefetch.running():
+            # The neighbour is already being decoded; load once it lands in
+            # the cache instead of decoding the same member a second time.
+            self._load_future = prefetch
+            prefetch.add_done_callback(lambda _future: self._submit_load(cache_key, load_args))
+        else:
+            if prefetch is not None:
+                prefetch.cancel()
+            self._load_future = self.thread_pool.submit(*load_args)
         self._schedule_result_poll()
 
+    def _submit_load(self, cache_key: tuple, load_args: tuple) -> None:
+        # Runs on the prefetch's worker thread; the follow-up load is a cache
+        # hit, so it is not tracked in _load_future. Skipped once the viewer
+        # has closed or moved on to another image.
+        if self._closed or cache_key != self._current_cache_key:
+            return
+        try:
+            self.thread_pool.submit(*load_args)
+        except RuntimeError:
+            # The shared pool has shut down; the application is exiting.
+            pass
+
     def _drain_queue(self) -> None:
-        while True:
-            try:
-                self.result_queue.get_nowait()
-            except queue.Empty:
-                break
+        drain_queue(self.result_queue)
+        drain_queue(self._prefetch_queue)
+
+    # Neighbor prefetch ---------------------------------------------------
+    def _prefetch_neighbors(self) -> None:
+        """Decode the images around the current one into the shared cache."""
+        if not self.settings.get("preload_next_thumbnail", True):
+            return
+        for index in (self.current_index + 1, self.current_index - 1):
+            if not (0 <= index < len(self.image_members)):
+                continue
+            future = self._prefetch_futures.get(index)
+            if future is not None and not future.done():
+                continue
+            member = self.image_members[index]
+            key = (self.zip_path, member)
+            if key in self.cache or self.cache.get_failure(key) is not None:
+                continue
+            future = self.thread_pool.submit(
+                load_image_data_async,
+                self.zip_path,
+                member,
+                self.max_load_size,
+                None,
+                self._prefetch_queue,
+                self.cache,
+                key,
+                self.zip_manager,
+                self.settings.get("performance_mode", False),
+            )
+            # The load has already put the image into the cache (or dropped
+            # it if over budget); do not hold a second full-size reference.
+            future.add_done_callback(self._discard_prefetch_results)
+            self._prefetch_futures[index] = future
+
+    def _discard_prefetch_results(self, _future: Future) -> None:
+        # Runs on the worker thread as each prefetch finishes.
+        drain_queue(self._prefetch_queue)
+
+    def _cancel_prefetches(self, keep_around: Optional[int] = None) -> None:
+        for prefetch_index in list(self._prefetch_futures):
+            if keep_around is not None and abs(prefetch_index - keep_around) <= 1:
+                continue
+            future = self._prefetch_futures.pop(prefetch_index)
+            if not future.done():
+                future.cancel()
 
     def _schedule_result_poll(self) -> None:
         if self._result_timer_active:
@@ -217,8 +294,10 @@ class ImageViewerWindow(QtWidgets.QDialog):
                 self._is_loading = False
                 if result.success and result.data:
                     self.current_pil_image = result.data
+                    self._full_pixmap = pil_image_to_qpixmap(result.data)
                     self.status_label.setText("")
                     self._update_display()
+                    self._prefetch_neighbors()
                 else:
                     message = result.error_message or "Failed to load image"
                     self.status_label.setText(message)
@@ -228,25 +307,44 @@ class ImageViewerWindow(QtWidgets.QDialog):
                 self._schedule_result_poll()
 
     def _update_display(self) -> None:
-        if self.current_pil_image is None:
+        if self.current_pil_image is None or self._full_pixmap is None:
             self.image_label.clear()
             return
 
-        img = self.current_pil_image.copy()
+        source = self._full_pixmap
         if self.fit_to_window:
             target_width = max(10, self.image_label.width() - 12)
             target_height = max(10, self.image_label.height() - 12)
-            img.thumbnail((target_width, target_height), self._resample_mode())
+            if source.width() <= target_width and source.height() <= target_height:
+                pixmap = source
+            else:
+                pixmap = source.scaled(
+                    target_width, target_height, QtCore.Qt.KeepAspectRatio, self._transform_mode()
+                )
         else:
-            new_width = int(img.width * self.zoom_factor)
-            new_height = int(img.height * self.zoom_factor)
-            if new_width > 0 and new_height > 0:
-                img = img.resize((new_width, new_height), self._resample_mode())
+            new_width = int(source.width() * self.zoom_factor)
+            new_height = int(source.height() * self.zoom_factor)
+            if new_width <= 0 or new_height <= 0:
+                pixmap = source
+            elif new_width <= source.width() and new_height <= source.height():
+                pixmap = source.scaled(
+                    new_width, new_height, QtCore.Qt.IgnoreAspectRatio, self._transform_mode()
+                )
+            else:
+                # Qt's smooth filter is bilinear; keep PIL resampling for enlargements.
+                img = self.current_pil_image.resize((new_width, new_height), self._resample_mode())
+                pixmap = pil_image_to_qpixmap(img)
 
-        pixmap = pil_image_to_qpixmap(img)
         self._current_pixmap = pixmap
         self.image_label.setPixmap(pixmap)
 
+    def _transform_mode(self) -> QtCore.Qt.TransformationMode:
+        return (
+            QtCore.Qt.FastTransformation
+            if self.settings.get("performance_mode", False)
+            else QtCore.Qt.SmoothTransformation
+        )
+
     def _resample_mode(self) -> int:
         return (
             Image.Resampling.NEAREST
@@ -255,37 +353,41 @@ class ImageViewerWindow(QtWidgets.QDialog):
         )
 
     # Event handling ------------------------------------------------------
+    _KEY_ACTIONS: Dict[int, str] = {
+        QtCore.Qt.Key_Left: "_show_prev",
+        QtCore.Qt.Key_PageUp: "_show_prev",
+        QtCore.Qt.Key_Right: "_show_next",
+        QtCore.Qt.Key_PageDown: "_show_next",
+        QtCore.Qt.Key_Escape: "close",
+        QtCore.Qt.Key_F: "_toggle_fit_to_window",
+        QtCore.Qt.Key_R: "_reset_zoom",
+        QtCore.Qt.Key_Home: "_show_first",
+        QtCore.Qt.Key_End: "_show_last",
+        QtCore.Qt.Key_F11: "_toggle_fullscreen",
+    }
+
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
-        key = event.key()
-        if key in (QtCore.Qt.Key_Left, QtCore.Qt.Key_PageUp):
-            self._show_prev()
-            return
-        if key in (QtCore.Qt.Key_Right, QtCore.Qt.Key_PageDown):
-            self._show_next()
-            return
-        if key == QtCore.Qt.Key_Escape:
-            self.close()
-            return
-        if key == QtCore.Qt.Key_F:
-            self.fit_to_window = not self.fit_to_window
-            self._update_display()
-            return
-        if key == QtCore.Qt.Key_R:
-            self.zoom_factor = 1.0
-            self.fit_to_window = True
-            self._update_display()
-            return
-        if key == QtCore.Qt.Key_Home:
-            self.load_image(0)
-            return
-        if key == QtCore.Qt.Key_End:
-            self.load_image(len(self.image_members) - 1)
-            return
-        if key == QtCore.Qt.Key_F11:
-            self._toggle_fullscreen()
+        action = self._KEY_ACTIONS.get(event.key())
+        if action is not None:
+            getattr(self, action)()
             return
         super().keyPressEvent(event)
 
+    def _toggle_fit_to_window(self) -> None:
+        self.fit_to_window = not self.fit_to_window
+        self._update_display()
+
+    def _reset_zoom(self) -> None:
+        self.zoom_factor = 1.0
+        self.fit_to_window = True
+        self._update_display()
+
+    def _show_first(self) -> None:
+        self.load_image(0)
+
+    def _show_last(self) -> None:
+        self.load_image(len(self.image_members) - 1)
+
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
         delta = event.angleDelta().y()
         if delta:
@@ -298,7 +400,7 @@ class ImageViewerWindow(QtWidgets.QDialog):
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
         if self.fit_to_window:
-            self._update_display()
+            self._resize_timer.start()
 
     def _toggle_fullscreen(self) -> None:
         self._is_fullscreen = not self._is_fullscreen
@@ -308,7 +410,10 @@ class ImageViewerWindow(QtWidgets.QDialog):
             self.showNormal()
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self._closed = True
         self._is_loading = False
+        self._resize_timer.stop()
         if self._load_future and not self._load_future.done():
             self._load_future.cancel()
+        self._cancel_prefetches()
         super().closeEvent(event)
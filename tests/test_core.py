@@ -0,0 +1,184 @@
+"""Tests for the image cache, the ZipFile pool and the analysis memo."""
+
+import os
+import zipfile
+
+from PIL import Image
+
+from arkview.core import LRUCache, ZipFileManager, ZipScanner, _image_nbytes
+
+
+def _image(width=10, height=10, mode="RGB"):
+    return Image.new(mode, (width, height))
+
+
+def _write_zip(path, members):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return str(path)
+
+
+# LRUCache -----------------------------------------------------------------
+
+def test_cache_evicts_oldest_unvisited_entry():
+    cache = LRUCache(3)
+    for name in "abc":
+        cache.put((name,), _image())
+    assert cache.get(("a",)) is not None
+
+    cache.put(("d",), _image())
+    assert ("b",) not in cache
+    assert ("a",) in cache
+
+    # The hand resumes after the last victim, so "c" goes next.
+    cache.put(("e",), _image())
+    assert ("c",) not in cache
+    assert {("a",), ("d",), ("e",)} == set(cache._nodes)
+
+
+def test_cache_respects_byte_budget():
+    cache = LRUCache(10, max_bytes=1000)
+    cache.put(("a",), _image())
+    cache.put(("b",), _image())
+    cache.put(("c",), _image())
+    cache.put(("d",), _image())
+    assert cache._bytes <= 1000
+    assert len(cache) == 3
+
+
+def test_cache_rejects_image_larger_than_budget():
+    cache = LRUCache(10, max_bytes=100)
+    cache.put(("big",), _image())
+    assert ("big",) not in cache
+    assert cache._bytes == 0
+
+
+def test_cache_evicts_others_when_replacement_grows():
+    cache = LRUCache(10, max_bytes=1000)
+    cache.put(("a",), _image())
+    cache.put(("b",), _image())
+    replacement = _image(18, 18)
+    cache.put(("a",), replacement)
+
+    assert cache._bytes <= 1000
+    assert cache.get(("a",)) is replacement
+    assert ("b",) not in cache
+
+
+def test_image_nbytes_counts_wide_modes():
+    assert _image_nbytes(_image(10, 10, "L")) == 100
+    assert _image_nbytes(_image(10, 10, "I;16")) == 200
+    assert _image_nbytes(_image(10, 10, "F")) == 400
+
+
+def test_shrink_to_keeps_capacity_and_visited_entries():
+    cache = LRUCache(8)
+    for index in range(8):
+        cache.put((index,), _image())
+    cache.get((0,))
+    cache.get((1,))
+
+    cache.shrink_to(2)
+    assert len(cache) == 2
+    assert (0,) in cache and (1,) in cache
+    assert cache.capacity == 8
+
+
+def test_failures_are_cleared_separately():
+    cache = LRUCache(4)
+    cache.put(("ok",), _image())
+    cache.put_failure(("bad",), "Invalid image format")
+    assert cache.get_failure(("bad",)) == "Invalid image format"
+
+    cache.clear_failures()
+    assert cache.get_failure(("bad",)) is None
+    assert ("ok",) in cache
+
+
+# ZipFileManager -------------------------------------------------------------
+
+def test_evicted_handle_stays_open_until_released(tmp_path):
+    first = _write_zip(tmp_path / "first.zip", {"a.png": b"x"})
+    second = _write_zip(tmp_path / "second.zip", {"b.png": b"x"})
+    manager = ZipFileManager(max_open_files=1)
+
+    with manager.open(first) as pinned:
+        # Opening a second archive evicts the first from the pool.
+        assert manager.get_zipfile(second) is not None
+        assert pinned.fp is not None
+        assert pinned.read("a.png") == b"x"
+    assert pinned.fp is None
+
+    manager.close_all()
+
+
+def test_unpinned_handle_closes_on_eviction(tmp_path):
+    first = _write_zip(tmp_path / "first.zip", {"a.png": b"x"})
+    second = _write_zip(tmp_path / "second.zip", {"b.png": b"x"})
+    manager = ZipFileManager(max_open_files=1)
+
+    handle = manager.get_zipfile(first)
+    manager.get_zipfile(second)
+    assert handle.fp is None
+
+    manager.close_all()
+
+
+# ZipScanner memo ------------------------------------------------------------
+
+def _counting_scanner(monkeypatch):
+    scanner = ZipScanner()
+    scanner.rust_scanner = None
+    calls = []
+    analyze = scanner._analyze_zip_python
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return analyze(*args, **kwargs)
+
+    monkeypatch.setattr(scanner, "_analyze_zip_python", counting)
+    return scanner, calls
+
+
+def test_analysis_is_memoized_until_file_changes(tmp_path, monkeypatch):
+    scanner, calls = _counting_scanner(monkeypatch)
+    path = _write_zip(tmp_path / "album.zip", {"a.png": b"x"})
+
+    first = scanner.analyze_zip(path)
+    second = scanner.analyze_zip(path)
+    assert first[:2] == (True, ["a.png"])
+    assert second == first
+    assert len(calls) == 1
+
+    # Same size, new mtime.
+    stat_result = os.stat(path)
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+    scanner.analyze_zip(path)
+    assert len(calls) == 2
+
+    # Rewritten with a different size.
+    _write_zip(path, {"a.png": b"x", "notes.txt": b"not an image"})
+    assert scanner.analyze_zip(path)[0] is False
+    assert len(calls) == 3
+
+
+def test_memo_hits_return_fresh_member_lists(tmp_path, monkeypatch):
+    scanner, _calls = _counting_scanner(monkeypatch)
+    path = _write_zip(tmp_path / "album.zip", {"a.png": b"x"})
+
+    scanner.analyze_zip(path)
+    first = scanner.analyze_zip(path)[1]
+    first.append("mutated.png")
+    assert scanner.analyze_zip(path)[1] == ["a.png"]
+
+
+def test_failed_open_is_not_memoized(tmp_path, monkeypatch):
+    scanner, calls = _counting_scanner(monkeypatch)
+    scanner.zip_manager = ZipFileManager()
+    path = _write_zip(tmp_path / "album.zip", {"a.png": b"x"})
+    monkeypatch.setattr(scanner.zip_manager, "get_zipfile", lambda _path: None)
+
+    assert scanner.analyze_zip(path)[0] is False
+    assert scanner.analyze_zip(path)[0] is False
+    assert len(calls) == 2